@@ -66,6 +66,7 @@ func main() {
 		log.Println("[WARN] OPENAI_API_KEY not set, chat and AI task generation will not work")
 		chatClient = openai.NewClient("dummy", cfg.OpenAIBaseURL, cfg.OpenAIModel, cfg.EmbeddingModel)
 	}
+	chatClient.SetMaxConcurrent(cfg.OpenAIMaxConcurrent)
 
 	// Initialize RAG service
 	ragService := service.NewRAGService(chatClient, ragRepo, cfg)
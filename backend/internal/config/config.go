@@ -11,7 +11,11 @@ import (
 
 type Config struct {
 	// Database
-	DatabaseURL string
+	DatabaseURL          string
+	DBMaxOpenConns       int
+	DBMaxIdleConns       int
+	DBConnMaxLifetimeMin int
+	DBConnMaxIdleTimeMin int
 
 	// JWT
 	JWTSecretKey              string
@@ -20,11 +24,12 @@ type Config struct {
 	JWTRefreshTokenExpireDays int
 
 	// OpenAI compatible API
-	OpenAIAPIKey   string
-	OpenAIBaseURL  string
-	OpenAIModel    string
-	ImageModel     string
-	EmbeddingModel string
+	OpenAIAPIKey        string
+	OpenAIBaseURL       string
+	OpenAIModel         string
+	ImageModel          string
+	EmbeddingModel      string
+	OpenAIMaxConcurrent int
 
 	// Firecrawl (web search)
 	FirecrawlAPIKey string
@@ -56,6 +61,10 @@ func Load() *Config {
 
 	cfg := &Config{
 		DatabaseURL:               getEnv("DATABASE_URL", ""),
+		DBMaxOpenConns:            getEnvInt("DB_MAX_OPEN_CONNS", 25),
+		DBMaxIdleConns:            getEnvInt("DB_MAX_IDLE_CONNS", 10),
+		DBConnMaxLifetimeMin:      getEnvInt("DB_CONN_MAX_LIFETIME_MINUTES", 30),
+		DBConnMaxIdleTimeMin:      getEnvInt("DB_CONN_MAX_IDLE_TIME_MINUTES", 5),
 		JWTSecretKey:              getEnv("JWT_SECRET_KEY", "change-me-in-production"),
 		JWTAlgorithm:              "HS256",
 		JWTAccessTokenExpireMin:   getEnvInt("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", 30),
@@ -63,6 +72,7 @@ func Load() *Config {
 		OpenAIAPIKey:              getEnv("OPENAI_API_KEY", ""),
 		OpenAIBaseURL:             getEnv("OPENAI_BASE_URL", "https://api-inference.modelscope.cn/v1"),
 		OpenAIModel:               getEnv("OPENAI_MODEL", "Qwen/Qwen3-235B-A22B"),
+		OpenAIMaxConcurrent:       getEnvInt("OPENAI_MAX_CONCURRENT", 16),
 		FirecrawlAPIKey:           getEnv("FIRECRAWL_API_KEY", ""),
 		ImageModel:                getEnv("IMAGE_MODEL", "Tongyi-MAI/Z-Image-Turbo"),
 		EmbeddingModel:            getEnv("EMBEDDING_MODEL", "iic/nlp_gte_sentence-embedding_chinese-base"),
@@ -1,10 +1,12 @@
 package database
 
 import (
+	"fmt"
 	"log"
 
 	"github.com/momshell/backend/internal/model"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 func Migrate(db *gorm.DB) error {
@@ -44,6 +46,37 @@ func Migrate(db *gorm.DB) error {
 		models = append(models, &model.KnowledgeEmbedding{})
 	}
 
+	// Collapse duplicate identity tags before their unique index is created
+	if db.Migrator().HasTable(&model.IdentityTag{}) {
+		db.Exec(`DELETE FROM identity_tags a USING identity_tags b
+			WHERE a.user_id = b.user_id AND a.tag_type = b.tag_type AND a.content = b.content
+			AND (a.created_at, a.id) > (b.created_at, b.id)`)
+	}
+
+	// Collapse duplicate task templates (concurrent first starts could both
+	// seed) before daily_tasks.title becomes unique. User tasks pointing at a
+	// duplicate are moved to the oldest template with the same title first.
+	if db.Migrator().HasTable(&model.DailyTask{}) {
+		if db.Migrator().HasTable(&model.UserTask{}) {
+			if err := db.Exec(`UPDATE user_tasks ut SET task_id = d.keep_id
+				FROM (SELECT id, first_value(id) OVER (PARTITION BY title ORDER BY created_at, id) AS keep_id
+					FROM daily_tasks) d
+				WHERE ut.task_id = d.id AND d.id <> d.keep_id`).Error; err != nil {
+				log.Printf("[migrate] WARNING: failed to repoint user tasks at surviving templates: %v", err)
+			}
+		}
+		if err := db.Exec(`DELETE FROM daily_tasks a USING daily_tasks b
+			WHERE a.title = b.title AND (a.created_at, a.id) > (b.created_at, b.id)`).Error; err != nil {
+			log.Printf("[migrate] WARNING: failed to remove duplicate daily tasks: %v", err)
+		}
+	}
+
+	// photos.tags becomes jsonb; untagged photos stored '' which is not JSON.
+	// Comparing as text keeps this a no-op once the column is converted.
+	if db.Migrator().HasTable(&model.Photo{}) {
+		db.Exec("UPDATE photos SET tags = '[]' WHERE tags IS NULL OR tags::text = ''")
+	}
+
 	if err := db.AutoMigrate(models...); err != nil {
 		return err
 	}
@@ -53,9 +86,40 @@ func Migrate(db *gorm.DB) error {
 		db.Exec("CREATE INDEX IF NOT EXISTS idx_knowledge_embeddings_content_fts ON knowledge_embeddings USING GIN (to_tsvector('simple', content))")
 	}
 
-	// Seed default daily tasks if none exist
-	seedDailyTasks(db)
-	seedAchievements(db)
+	// idx_user_tasks_user_date (user_id, date) covers user_id-only lookups too
+	db.Exec("DROP INDEX IF EXISTS idx_user_tasks_user_id")
+
+	// XP, level and achievement checks only aggregate verified tasks; a partial
+	// covering index lets SUM(score)/COUNT(*) per user run as index-only scans
+	db.Exec("CREATE INDEX IF NOT EXISTS idx_user_tasks_verified_score ON user_tasks (user_id) INCLUDE (score) WHERE status = 'verified'")
+
+	// Mission sync clears a dad's still-pending tasks for the day; index only
+	// the actionable rows so the index stays small as history accumulates
+	db.Exec("CREATE INDEX IF NOT EXISTS idx_user_tasks_pending ON user_tasks (user_id, date) WHERE status = 'pending'")
+
+	// One row per (user, fact content), soft-deleted rows included, so a
+	// deleted fact is not re-learned. Keep the live, then oldest, copy of any
+	// duplicates saved before the index existed. content is free text, so
+	// the index is on its md5 to stay within the btree row size limit.
+	// ChatRepo.CreateFactIfAbsent relies on this index alone to skip
+	// duplicates, so failing to build it stops startup.
+	if !db.Migrator().HasIndex(&model.ChatMemoryFact{}, "idx_chat_memory_facts_user_content") {
+		if err := db.Exec(`DELETE FROM chat_memory_facts a USING chat_memory_facts b
+			WHERE a.user_id = b.user_id AND a.content = b.content AND a.id <> b.id
+			AND (a.deleted_at IS NOT NULL, a.created_at, a.id) > (b.deleted_at IS NOT NULL, b.created_at, b.id)`).Error; err != nil {
+			log.Printf("[migrate] WARNING: failed to remove duplicate chat memory facts: %v", err)
+		}
+		if err := db.Exec("CREATE UNIQUE INDEX IF NOT EXISTS idx_chat_memory_facts_user_content ON chat_memory_facts (user_id, md5(content))").Error; err != nil {
+			return fmt.Errorf("create chat memory fact unique index: %w", err)
+		}
+	}
+
+	// Memoir pages seek on (created_at, id) within a user; the composite index
+	// turns each page into a bounded range scan instead of a sort of them all
+	db.Exec("CREATE INDEX IF NOT EXISTS idx_memoirs_user_created_id ON memoirs (user_id, created_at DESC, id DESC)")
+
+	// Seed any default daily tasks and achievements that are missing
+	seedPresets(db)
 
 	// Migrate legacy role='admin' users to is_admin flag
 	db.Model(&model.User{}).Where("role = ?", "admin").Updates(map[string]interface{}{
@@ -79,77 +143,103 @@ func Migrate(db *gorm.DB) error {
 	return nil
 }
 
-func seedDailyTasks(db *gorm.DB) {
-	var count int64
-	db.Model(&model.DailyTask{}).Count(&count)
-	if count > 0 {
-		return
-	}
+// Default task templates and achievements, built once per process. Seeding
+// copies rows out of these slices, so gorm never mutates the presets.
+var dailyTaskPresets = []model.DailyTask{
+	// Housework
+	{Title: "做一顿早餐", Description: "为家人准备一份营养早餐", Category: model.TaskCategoryHousework, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "整理卧室", Description: "整理床铺、叠好衣物", Category: model.TaskCategoryHousework, Difficulty: 1, Priority: model.PriorityT2},
+	{Title: "打扫客厅", Description: "扫地、拖地、整理杂物", Category: model.TaskCategoryHousework, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "清洁厨房", Description: "洗碗、擦台面、清理灶台", Category: model.TaskCategoryHousework, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "洗一次衣服", Description: "把脏衣服分类洗好、晾晒", Category: model.TaskCategoryHousework, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "倒垃圾", Description: "把垃圾分类打包扔掉", Category: model.TaskCategoryHousework, Difficulty: 1, Priority: model.PriorityT2},
+	// Parenting
+	{Title: "学习婴儿急救知识", Description: "看一篇婴儿急救相关的文章或视频", Category: model.TaskCategoryParenting, Difficulty: 3, Priority: model.PriorityT2},
+	{Title: "了解宝宝辅食添加", Description: "学习适龄辅食的种类和注意事项", Category: model.TaskCategoryParenting, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "学习安抚哭闹技巧", Description: "学习如何科学安抚宝宝", Category: model.TaskCategoryParenting, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "阅读一篇育儿文章", Description: "选一篇科学育儿知识文章阅读", Category: model.TaskCategoryParenting, Difficulty: 1, Priority: model.PriorityT2},
+	{Title: "陪宝宝互动 15 分钟", Description: "放下手机，全身心陪伴宝宝玩耍", Category: model.TaskCategoryParenting, Difficulty: 2, Priority: model.PriorityT2},
+	// Health
+	{Title: "陪妈妈散步 30 分钟", Description: "陪伴一起户外走走，呼吸新鲜空气", Category: model.TaskCategoryHealth, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "提醒妈妈按时吃饭", Description: "确保她三餐按时吃、营养均衡", Category: model.TaskCategoryHealth, Difficulty: 1, Priority: model.PriorityT2},
+	{Title: "帮妈妈做肩颈按摩", Description: "帮她放松一下肩颈，缓解疲劳", Category: model.TaskCategoryHealth, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "提醒妈妈喝水", Description: "关心她的饮水量，适时提醒", Category: model.TaskCategoryHealth, Difficulty: 1, Priority: model.PriorityT2},
+	// Emotional
+	{Title: "给妈妈写一段鼓励的话", Description: "用文字表达你对她的感谢和支持", Category: model.TaskCategoryEmotional, Difficulty: 3, Priority: model.PriorityT2},
+	{Title: "主动询问她今天的感受", Description: "认真倾听她的心情，不急着给建议", Category: model.TaskCategoryEmotional, Difficulty: 2, Priority: model.PriorityT2},
+	{Title: "准备一个小惊喜", Description: "一杯热饮、一束花、或一句暖心的话", Category: model.TaskCategoryEmotional, Difficulty: 3, Priority: model.PriorityT2},
+	{Title: "主动承担一次夜间照顾", Description: "让妈妈好好休息一晚", Category: model.TaskCategoryEmotional, Difficulty: 4, Priority: model.PriorityT2},
+	{Title: "表达一次感谢", Description: "告诉她你看到了她的付出和辛苦", Category: model.TaskCategoryEmotional, Difficulty: 1, Priority: model.PriorityT2},
+}
 
-	tasks := []model.DailyTask{
-		// Housework
-		{Title: "做一顿早餐", Description: "为家人准备一份营养早餐", Category: model.TaskCategoryHousework, Difficulty: 2},
-		{Title: "整理卧室", Description: "整理床铺、叠好衣物", Category: model.TaskCategoryHousework, Difficulty: 1},
-		{Title: "打扫客厅", Description: "扫地、拖地、整理杂物", Category: model.TaskCategoryHousework, Difficulty: 2},
-		{Title: "清洁厨房", Description: "洗碗、擦台面、清理灶台", Category: model.TaskCategoryHousework, Difficulty: 2},
-		{Title: "洗一次衣服", Description: "把脏衣服分类洗好、晾晒", Category: model.TaskCategoryHousework, Difficulty: 2},
-		{Title: "倒垃圾", Description: "把垃圾分类打包扔掉", Category: model.TaskCategoryHousework, Difficulty: 1},
-		// Parenting
-		{Title: "学习婴儿急救知识", Description: "看一篇婴儿急救相关的文章或视频", Category: model.TaskCategoryParenting, Difficulty: 3},
-		{Title: "了解宝宝辅食添加", Description: "学习适龄辅食的种类和注意事项", Category: model.TaskCategoryParenting, Difficulty: 2},
-		{Title: "学习安抚哭闹技巧", Description: "学习如何科学安抚宝宝", Category: model.TaskCategoryParenting, Difficulty: 2},
-		{Title: "阅读一篇育儿文章", Description: "选一篇科学育儿知识文章阅读", Category: model.TaskCategoryParenting, Difficulty: 1},
-		{Title: "陪宝宝互动 15 分钟", Description: "放下手机，全身心陪伴宝宝玩耍", Category: model.TaskCategoryParenting, Difficulty: 2},
-		// Health
-		{Title: "陪妈妈散步 30 分钟", Description: "陪伴一起户外走走，呼吸新鲜空气", Category: model.TaskCategoryHealth, Difficulty: 2},
-		{Title: "提醒妈妈按时吃饭", Description: "确保她三餐按时吃、营养均衡", Category: model.TaskCategoryHealth, Difficulty: 1},
-		{Title: "帮妈妈做肩颈按摩", Description: "帮她放松一下肩颈，缓解疲劳", Category: model.TaskCategoryHealth, Difficulty: 2},
-		{Title: "提醒妈妈喝水", Description: "关心她的饮水量，适时提醒", Category: model.TaskCategoryHealth, Difficulty: 1},
-		// Emotional
-		{Title: "给妈妈写一段鼓励的话", Description: "用文字表达你对她的感谢和支持", Category: model.TaskCategoryEmotional, Difficulty: 3},
-		{Title: "主动询问她今天的感受", Description: "认真倾听她的心情，不急着给建议", Category: model.TaskCategoryEmotional, Difficulty: 2},
-		{Title: "准备一个小惊喜", Description: "一杯热饮、一束花、或一句暖心的话", Category: model.TaskCategoryEmotional, Difficulty: 3},
-		{Title: "主动承担一次夜间照顾", Description: "让妈妈好好休息一晚", Category: model.TaskCategoryEmotional, Difficulty: 4},
-		{Title: "表达一次感谢", Description: "告诉她你看到了她的付出和辛苦", Category: model.TaskCategoryEmotional, Difficulty: 1},
-	}
+var achievementPresets = []model.Achievement{
+	{
+		Code:        "aap_apprentice",
+		Title:       "AAP见习奶爸",
+		Description: "累计完成并验收 10 个任务",
+		Condition:   `{"type":"task_count","min":10}`,
+	},
+	{
+		Code:        "sleep_master",
+		Title:       "哄睡大师",
+		Description: "情绪安抚维度达到 20",
+		Condition:   `{"type":"dimension_min","dimension":"emotional","min":20}`,
+	},
+	{
+		Code:        "logistics_pro",
+		Title:       "后勤达人",
+		Description: "后勤保障维度达到 30",
+		Condition:   `{"type":"dimension_min","dimension":"logistics","min":30}`,
+	},
+}
 
-	for i := range tasks {
-		if tasks[i].Priority == "" {
-			tasks[i].Priority = model.PriorityT2
+func seedPresets(db *gorm.DB) {
+	// Both preset tables commit together: one transaction, one WAL flush
+	err := db.Transaction(func(tx *gorm.DB) error {
+		if err := seedDailyTasks(tx); err != nil {
+			return fmt.Errorf("seed daily tasks: %w", err)
+		}
+		if err := seedAchievements(tx); err != nil {
+			return fmt.Errorf("seed achievements: %w", err)
 		}
-		db.Create(&tasks[i])
+		return nil
+	})
+	if err != nil {
+		log.Printf("[migrate] %v", err)
 	}
 }
 
-func seedAchievements(db *gorm.DB) {
-	var count int64
-	db.Model(&model.Achievement{}).Count(&count)
-	if count > 0 {
-		return
+func seedDailyTasks(db *gorm.DB) error {
+	// title is unique, so the database skips presets that already exist.
+	// One multi-row INSERT is the whole pass, with no probe query first,
+	// and concurrent instances seeding at once cannot collide.
+	rows := make([]model.DailyTask, len(dailyTaskPresets))
+	copy(rows, dailyTaskPresets)
+	res := db.Clauses(clause.OnConflict{
+		Columns:   []clause.Column{{Name: "title"}},
+		DoNothing: true,
+	}).Create(&rows)
+	if res.Error != nil {
+		return res.Error
 	}
-
-	achievements := []model.Achievement{
-		{
-			Code:        "aap_apprentice",
-			Title:       "AAP见习奶爸",
-			Description: "累计完成并验收 10 个任务",
-			Condition:   `{"type":"task_count","min":10}`,
-		},
-		{
-			Code:        "sleep_master",
-			Title:       "哄睡大师",
-			Description: "情绪安抚维度达到 20",
-			Condition:   `{"type":"dimension_min","dimension":"emotional","min":20}`,
-		},
-		{
-			Code:        "logistics_pro",
-			Title:       "后勤达人",
-			Description: "后勤保障维度达到 30",
-			Condition:   `{"type":"dimension_min","dimension":"logistics","min":30}`,
-		},
+	if res.RowsAffected > 0 {
+		log.Printf("[migrate] seeded %d daily task templates", res.RowsAffected)
 	}
+	return nil
+}
 
-	for i := range achievements {
-		db.Create(&achievements[i])
+func seedAchievements(db *gorm.DB) error {
+	rows := make([]model.Achievement, len(achievementPresets))
+	copy(rows, achievementPresets)
+	res := db.Clauses(clause.OnConflict{
+		Columns:   []clause.Column{{Name: "code"}},
+		DoNothing: true,
+	}).Create(&rows)
+	if res.Error != nil {
+		return res.Error
+	}
+	if res.RowsAffected > 0 {
+		log.Printf("[migrate] seeded %d achievements", res.RowsAffected)
 	}
+	return nil
 }
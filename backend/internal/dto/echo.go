@@ -1,6 +1,10 @@
 package dto
 
-import "github.com/momshell/backend/internal/model"
+import (
+	"time"
+
+	"github.com/momshell/backend/internal/model"
+)
 
 type IdentityTagCreateRequest struct {
 	TagType string `json:"tag_type" binding:"required,oneof=music sound literature memory"`
@@ -18,9 +22,20 @@ type GenerateMemoirRequest struct {
 	Theme *string `json:"theme" binding:"omitempty,max=100"`
 }
 
+type MemoirResponse struct {
+	ID            string    `json:"id"`
+	Title         string    `json:"title"`
+	Content       string    `json:"content"`
+	CoverImageURL *string   `json:"cover_image_url"`
+	UserRating    *int      `json:"user_rating"`
+	CreatedAt     time.Time `json:"created_at"`
+	UpdatedAt     time.Time `json:"updated_at"`
+}
+
 type MemoirListResponse struct {
-	Memoirs []model.Memoir `json:"memoirs"`
-	Total   int64          `json:"total"`
+	Memoirs    []MemoirResponse `json:"memoirs"`
+	Total      *int64           `json:"total,omitempty"` // nil on cursor pages
+	NextCursor string           `json:"next_cursor,omitempty"`
 }
 
 type RateMemoirRequest struct {
@@ -6,6 +6,7 @@ import (
 	"strconv"
 
 	"github.com/gin-gonic/gin"
+	"github.com/gin-gonic/gin/binding"
 	"github.com/momshell/backend/internal/dto"
 	"github.com/momshell/backend/internal/middleware"
 	"github.com/momshell/backend/internal/service"
@@ -17,9 +18,25 @@ type EchoHandler struct {
 }
 
 func NewEchoHandler(echoService *service.EchoService) *EchoHandler {
+	warmBindingValidators(
+		&dto.IdentityTagCreateRequest{},
+		&dto.GenerateMemoirRequest{},
+		&dto.RateMemoirRequest{},
+	)
 	return &EchoHandler{echoService: echoService}
 }
 
+// warmBindingValidators runs the validator once over zero values so the
+// per-struct tag cache is built at startup instead of on the first request.
+func warmBindingValidators(objs ...any) {
+	if binding.Validator == nil {
+		return
+	}
+	for _, obj := range objs {
+		_ = binding.Validator.ValidateStruct(obj)
+	}
+}
+
 func (h *EchoHandler) GetIdentityTags(c *gin.Context) {
 	userID := middleware.GetUserID(c)
 
@@ -92,8 +109,12 @@ func (h *EchoHandler) GetMemoirs(c *gin.Context) {
 	}
 
 	userID := middleware.GetUserID(c)
-	resp, err := h.echoService.GetMemoirs(userID, limit, offset)
+	resp, err := h.echoService.GetMemoirs(userID, limit, offset, c.Query("before"))
 	if err != nil {
+		if errors.Is(err, service.ErrInvalidMemoirCursor) {
+			c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+			return
+		}
 		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
@@ -2,7 +2,6 @@ package handler
 
 import (
 	"context"
-	"fmt"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -109,7 +108,7 @@ func (h *PhotoHandler) Upload(c *gin.Context) {
 		return
 	}
 
-	imageURL := fmt.Sprintf("/uploads/photos/%s", filename)
+	imageURL := "/uploads/photos/" + filename
 	title := c.PostForm("title")
 
 	result, err := h.photoService.CreateFromUpload(userID, title, imageURL)
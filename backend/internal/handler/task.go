@@ -1,9 +1,13 @@
 package handler
 
 import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
 	"errors"
 	"io"
 	"net/http"
+	"strings"
 
 	"github.com/gin-gonic/gin"
 	"github.com/momshell/backend/internal/dto"
@@ -133,7 +137,7 @@ func (h *TaskHandler) Stats(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, stats)
+	jsonWithETag(c, stats)
 }
 
 // GET /api/v1/tasks/baby-age
@@ -180,7 +184,7 @@ func (h *TaskHandler) Radar(c *gin.Context) {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
-	c.JSON(http.StatusOK, radar)
+	jsonWithETag(c, radar)
 }
 
 // GET /api/v1/tasks/achievements
@@ -191,7 +195,42 @@ func (h *TaskHandler) Achievements(c *gin.Context) {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
 	}
-	c.JSON(http.StatusOK, items)
+	jsonWithETag(c, items)
+}
+
+// jsonWithETag writes obj as JSON tagged with a hash of the body. The
+// progress endpoints are polled far more often than they change, so a
+// client that revalidates with If-None-Match gets an empty 304 instead of
+// the same payload again.
+func jsonWithETag(c *gin.Context, obj any) {
+	body, err := json.Marshal(obj)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	sum := sha256.Sum256(body)
+	etag := `"` + hex.EncodeToString(sum[:16]) + `"`
+
+	// The API default is no-store, which stops clients from keeping the
+	// body they would revalidate against
+	c.Header("Cache-Control", "private, no-cache")
+	c.Header("ETag", etag)
+	if etagMatches(c.GetHeader("If-None-Match"), etag) {
+		c.Status(http.StatusNotModified)
+		return
+	}
+	c.Data(http.StatusOK, "application/json; charset=utf-8", body)
+}
+
+// etagMatches applies the weak comparison If-None-Match calls for.
+func etagMatches(header, etag string) bool {
+	for _, candidate := range strings.Split(header, ",") {
+		candidate = strings.TrimSpace(candidate)
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == etag {
+			return true
+		}
+	}
+	return false
 }
 
 // POST /api/v1/tasks/:id/card/regenerate
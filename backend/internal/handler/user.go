@@ -1,10 +1,10 @@
 package handler
 
 import (
-	"fmt"
 	"net/http"
 	"os"
 	"path/filepath"
+	"strconv"
 
 	"github.com/gin-gonic/gin"
 	"github.com/momshell/backend/internal/dto"
@@ -126,9 +126,8 @@ func (h *UserHandler) UploadAvatar(c *gin.Context) {
 		return
 	}
 
-	avatarURL := fmt.Sprintf("/uploads/avatars/%s", filename)
 	// Add cache-busting query param so browser refreshes the image
-	avatarURLWithBust := fmt.Sprintf("%s?v=%d", avatarURL, header.Size)
+	avatarURLWithBust := "/uploads/avatars/" + filename + "?v=" + strconv.FormatInt(header.Size, 10)
 
 	profile, err := h.userService.UpdateProfile(userID, dto.UserProfileUpdate{
 		AvatarURL: &avatarURLWithBust,
@@ -49,11 +49,12 @@ func (rl *rateLimiter) allow(ip string) bool {
 	rl.mu.Lock()
 	defer rl.mu.Unlock()
 
+	now := time.Now()
 	v, exists := rl.visitors[ip]
-	if !exists || time.Now().After(v.resetAt) {
+	if !exists || now.After(v.resetAt) {
 		rl.visitors[ip] = &visitor{
 			count:   1,
-			resetAt: time.Now().Add(rl.window),
+			resetAt: now.Add(rl.window),
 		}
 		return true
 	}
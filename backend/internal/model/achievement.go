@@ -25,7 +25,7 @@ type Achievement struct {
 	Title       string    `gorm:"type:varchar(100);not null" json:"title"`
 	Description string    `gorm:"type:varchar(255);not null" json:"description"`
 	IconURL     string    `gorm:"type:text" json:"icon_url"`
-	Condition   string    `gorm:"type:text" json:"condition"` // JSON string describing unlock condition
+	Condition   string    `gorm:"type:jsonb" json:"condition"` // JSON document describing unlock condition
 	CreatedAt   time.Time `json:"created_at"`
 }
 
@@ -33,7 +33,7 @@ type Question struct {
 	// Content
 	Title     string  `gorm:"type:varchar(200);index;not null" json:"title"`
 	Content   string  `gorm:"type:text;not null" json:"content"`
-	ImageURLs *string `gorm:"type:text" json:"image_urls"` // JSON array
+	ImageURLs *string `gorm:"type:jsonb" json:"image_urls"` // JSON array
 
 	// Channel
 	Channel ChannelType `gorm:"type:varchar(20);index;default:'experience'" json:"channel"`
@@ -79,7 +79,7 @@ type Answer struct {
 
 	// Content
 	Content   string  `gorm:"type:text;not null" json:"content"`
-	ImageURLs *string `gorm:"type:text" json:"image_urls"`
+	ImageURLs *string `gorm:"type:jsonb" json:"image_urls"`
 
 	// Author role info
 	AuthorRole     UserRole `gorm:"type:varchar(30);index" json:"author_role"`
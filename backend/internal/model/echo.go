@@ -9,9 +9,9 @@ import (
 
 type IdentityTag struct {
 	ID        string    `gorm:"type:varchar(36);primaryKey" json:"id"`
-	UserID    string    `gorm:"type:varchar(36);index;not null" json:"-"`
-	TagType   string    `gorm:"type:varchar(20);not null" json:"tag_type"`
-	Content   string    `gorm:"type:varchar(200);not null" json:"content"`
+	UserID    string    `gorm:"type:varchar(36);index;uniqueIndex:idx_identity_tag_content;not null" json:"-"`
+	TagType   string    `gorm:"type:varchar(20);uniqueIndex:idx_identity_tag_content;not null" json:"tag_type"`
+	Content   string    `gorm:"type:varchar(200);uniqueIndex:idx_identity_tag_content;not null" json:"content"`
 	CreatedAt time.Time `json:"created_at"`
 
 	User User `gorm:"foreignKey:UserID" json:"-"`
@@ -64,7 +64,7 @@ type ModerationLog struct {
 	ModerationType      string           `gorm:"type:varchar(20);not null" json:"moderation_type"` // auto, manual
 	Result              ModerationResult `gorm:"type:varchar(30);not null" json:"result"`
 	SensitiveCategories *string          `gorm:"type:text" json:"sensitive_categories"` // JSON array
-	ConfidenceScore     *float64         `json:"confidence_score"`
+	ConfidenceScore     *float64         `gorm:"type:double precision" json:"confidence_score"`
 	Reason              *string          `gorm:"type:text" json:"reason"`
 	OriginalContent     *string          `gorm:"type:text" json:"original_content"`
 	ReviewerID          *string          `gorm:"type:varchar(36)" json:"reviewer_id"`
@@ -12,7 +12,7 @@ type Photo struct {
 	UserID       string    `gorm:"type:varchar(36);index;not null" json:"-"`
 	Title        string    `gorm:"type:varchar(200)" json:"title"`
 	Description  string    `gorm:"type:text" json:"description"`
-	Tags         string    `gorm:"type:text" json:"tags"`
+	Tags         string    `gorm:"type:jsonb;not null;default:'[]'" json:"tags"` // JSON array
 	ImageURL     string    `gorm:"type:varchar(500);not null" json:"image_url"`
 	IsOnWall     bool      `gorm:"default:false" json:"is_on_wall"`
 	WallPosition *int      `gorm:"type:int" json:"wall_position"`
@@ -38,7 +38,7 @@ const (
 // DailyTask is a task template from which user tasks are generated.
 type DailyTask struct {
 	ID          string       `gorm:"type:varchar(36);primaryKey" json:"id"`
-	Title       string       `gorm:"type:varchar(200);not null" json:"title"`
+	Title       string       `gorm:"type:varchar(200);uniqueIndex;not null" json:"title"`
 	Description string       `gorm:"type:text" json:"description"`
 	Category    TaskCategory `gorm:"type:varchar(50);not null;index" json:"category"`
 	Difficulty  int          `gorm:"default:1" json:"difficulty"` // 1-5
@@ -65,10 +65,10 @@ const (
 // UserTask is a concrete task assigned to a user on a given date.
 type UserTask struct {
 	ID     string  `gorm:"type:varchar(36);primaryKey" json:"id"`
-	UserID string  `gorm:"type:varchar(36);not null;index" json:"user_id"`
+	UserID string  `gorm:"type:varchar(36);not null;index:idx_user_tasks_user_date,priority:1" json:"user_id"`
 	TaskID *string `gorm:"type:varchar(36)" json:"task_id"` // nil for AI tasks
 
-	Date   time.Time  `gorm:"type:date;not null;index" json:"date"`
+	Date   time.Time  `gorm:"type:date;not null;index;index:idx_user_tasks_user_date,priority:2" json:"date"`
 	Status TaskStatus `gorm:"type:varchar(20);default:'pending'" json:"status"`
 
 	// Priority level
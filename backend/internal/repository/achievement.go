@@ -3,6 +3,7 @@ package repository
 import (
 	"github.com/momshell/backend/internal/model"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 type AchievementRepo struct {
@@ -21,10 +22,11 @@ func (r *AchievementRepo) FindAll() ([]model.Achievement, error) {
 	return achievements, nil
 }
 
+// FindUserAchievements returns the user's unlock rows without the catalog
+// entries; callers join them against the cached catalog by AchievementID.
 func (r *AchievementRepo) FindUserAchievements(userID string) ([]model.UserAchievement, error) {
 	var unlocked []model.UserAchievement
-	if err := r.db.Preload("Achievement").
-		Where("user_id = ?", userID).
+	if err := r.db.Where("user_id = ?", userID).
 		Order("unlocked_at asc").
 		Find(&unlocked).Error; err != nil {
 		return nil, err
@@ -32,6 +34,15 @@ func (r *AchievementRepo) FindUserAchievements(userID string) ([]model.UserAchie
 	return unlocked, nil
 }
 
-func (r *AchievementRepo) CreateUserAchievement(ua *model.UserAchievement) error {
-	return r.db.Create(ua).Error
+// CreateUserAchievements records the unlocks in one multi-row INSERT.
+// Unlocks the user already has are skipped by the unique index, so
+// concurrent checks for the same user cannot fail or double-unlock.
+func (r *AchievementRepo) CreateUserAchievements(uas []model.UserAchievement) error {
+	if len(uas) == 0 {
+		return nil
+	}
+	return r.db.Clauses(clause.OnConflict{
+		Columns:   []clause.Column{{Name: "user_id"}, {Name: "achievement_id"}},
+		DoNothing: true,
+	}).Create(&uas).Error
 }
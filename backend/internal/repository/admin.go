@@ -71,21 +71,19 @@ func (r *AdminRepo) CountUsersByRole() (map[string]int64, error) {
 	return m, nil
 }
 
-// CountUsers returns total, active, banned, and guest user counts
+// CountUsers returns total, active, banned, and guest user counts from a
+// single scan of users.
 func (r *AdminRepo) CountUsers() (total, active, banned, guest int64, err error) {
-	if err = r.db.Model(&model.User{}).Count(&total).Error; err != nil {
-		return
+	var counts struct {
+		Total, Active, Banned, Guest int64
 	}
-	if err = r.db.Model(&model.User{}).Where("is_active = ? AND is_banned = ?", true, false).Count(&active).Error; err != nil {
-		return
-	}
-	if err = r.db.Model(&model.User{}).Where("is_banned = ?", true).Count(&banned).Error; err != nil {
-		return
-	}
-	if err = r.db.Model(&model.User{}).Where("is_guest = ?", true).Count(&guest).Error; err != nil {
-		return
-	}
-	return
+	err = r.db.Model(&model.User{}).
+		Select(`COUNT(*) AS total,
+			COUNT(*) FILTER (WHERE is_active AND NOT is_banned) AS active,
+			COUNT(*) FILTER (WHERE is_banned) AS banned,
+			COUNT(*) FILTER (WHERE is_guest) AS guest`).
+		Scan(&counts).Error
+	return counts.Total, counts.Active, counts.Banned, counts.Guest, err
 }
 
 // DeleteUser hard-deletes a user by ID
@@ -114,11 +112,13 @@ func (r *AdminRepo) CountCertifications() (int64, error) {
 	return count, err
 }
 
-// CountPhotos returns total photo count and wall photo count
+// CountPhotos returns total photo count and wall photo count in one query
 func (r *AdminRepo) CountPhotos() (total, wall int64, err error) {
-	if err = r.db.Model(&model.Photo{}).Count(&total).Error; err != nil {
-		return
+	var counts struct {
+		Total, Wall int64
 	}
-	err = r.db.Model(&model.Photo{}).Where(whereIsOnWall, true).Count(&wall).Error
-	return
+	err = r.db.Model(&model.Photo{}).
+		Select("COUNT(*) AS total, COUNT(*) FILTER (WHERE is_on_wall) AS wall").
+		Scan(&counts).Error
+	return counts.Total, counts.Wall, err
 }
@@ -37,6 +37,14 @@ func (r *ChatRepo) Create(m *model.ChatMemory) error {
 	return r.db.Create(m).Error
 }
 
+// UpdateSummary sets only the conversation summary, leaving the turns
+// written by concurrent chat requests untouched.
+func (r *ChatRepo) UpdateSummary(userID, summary string) error {
+	return r.db.Model(&model.ChatMemory{}).
+		Where(whereUserID, userID).
+		Update("conversation_summary", summary).Error
+}
+
 // UpdateSummaryAndTurns updates only the summary and turns fields.
 func (r *ChatRepo) UpdateSummaryAndTurns(userID, summary, turns string) error {
 	return r.db.Model(&model.ChatMemory{}).
@@ -49,9 +57,10 @@ func (r *ChatRepo) UpdateSummaryAndTurns(userID, summary, turns string) error {
 
 // --- ChatMemoryFact methods ---
 
-func (r *ChatRepo) FindFactsByUserID(userID string) ([]model.ChatMemoryFact, error) {
+// FindFactsByUserID returns the user's newest facts, at most limit of them.
+func (r *ChatRepo) FindFactsByUserID(userID string, limit int) ([]model.ChatMemoryFact, error) {
 	var facts []model.ChatMemoryFact
-	err := r.db.Where(whereUserID, userID).Order(orderCreatedAtDesc).Find(&facts).Error
+	err := r.db.Where(whereUserID, userID).Order(orderCreatedAtDesc).Limit(limit).Find(&facts).Error
 	return facts, err
 }
 
@@ -64,20 +73,18 @@ func (r *ChatRepo) FindFactByID(id string) (*model.ChatMemoryFact, error) {
 	return &f, nil
 }
 
-func (r *ChatRepo) CreateFact(f *model.ChatMemoryFact) error {
-	return r.db.Create(f).Error
-}
-
 func (r *ChatRepo) DeleteFact(id string) error {
 	return r.db.Where(whereID, id).Delete(&model.ChatMemoryFact{}).Error
 }
 
-func (r *ChatRepo) FactExistsByContent(userID, content string) (bool, error) {
-	var count int64
-	err := r.db.Unscoped().Model(&model.ChatMemoryFact{}).
-		Where("user_id = ? AND content = ?", userID, content).
-		Count(&count).Error
-	return count > 0, err
+// CreateFactIfAbsent inserts the fact unless the user already has one with
+// the same content, soft-deleted ones included. The unique index
+// idx_chat_memory_facts_user_content makes the check part of the INSERT, so
+// concurrent saves of the same fact cannot both land. It reports whether a
+// row was inserted.
+func (r *ChatRepo) CreateFactIfAbsent(f *model.ChatMemoryFact) (bool, error) {
+	res := r.db.Clauses(clause.OnConflict{DoNothing: true}).Create(f)
+	return res.RowsAffected > 0, res.Error
 }
 
 func (r *ChatRepo) TouchFactReferencedAt(ids []string) error {
@@ -122,13 +129,15 @@ func (r *ChatRepo) FindFactsByFamilyIDs(familyIDs []string) ([]model.ChatMemoryF
 	return facts, err
 }
 
-func (r *ChatRepo) FindDeletedFactsByFamilyIDs(familyIDs []string) ([]model.ChatMemoryFact, error) {
-	var facts []model.ChatMemoryFact
+// FindDeletedFactContentsByFamilyIDs returns the distinct contents of facts
+// the family deleted in the last 90 days. Only the content column is read.
+func (r *ChatRepo) FindDeletedFactContentsByFamilyIDs(familyIDs []string) ([]string, error) {
+	var contents []string
 	cutoff := time.Now().AddDate(0, 0, -90)
-	err := r.db.Unscoped().
+	err := r.db.Unscoped().Model(&model.ChatMemoryFact{}).
 		Where("user_id IN ? AND deleted_at IS NOT NULL AND deleted_at > ?", familyIDs, cutoff).
-		Find(&facts).Error
-	return facts, err
+		Distinct().Pluck("content", &contents).Error
+	return contents, err
 }
 
 func (r *ChatRepo) FactExistsByContentFamily(familyIDs []string, content string) (bool, error) {
@@ -56,8 +56,11 @@ func (r *CommentRepo) DeleteByParentID(parentID string) (int64, error) {
 	return result.RowsAffected, result.Error
 }
 
-func (r *CommentRepo) DeleteByAnswerID(answerID string) error {
-	return r.db.Where("answer_id = ?", answerID).Delete(&model.Comment{}).Error
+func (r *CommentRepo) DeleteByAnswerID(answerIDs ...string) error {
+	if len(answerIDs) == 0 {
+		return nil
+	}
+	return r.db.Where("answer_id IN ?", answerIDs).Delete(&model.Comment{}).Error
 }
 
 func (r *CommentRepo) UpdateLikeCount(id string, delta int) error {
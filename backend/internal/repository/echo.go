@@ -3,6 +3,7 @@ package repository
 import (
 	"github.com/momshell/backend/internal/model"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 )
 
 type EchoRepo struct {
@@ -13,9 +14,10 @@ func NewEchoRepo(db *gorm.DB) *EchoRepo {
 	return &EchoRepo{db: db}
 }
 
+// FindIdentityTagsByUserID returns tags grouped by type, newest first within each type.
 func (r *EchoRepo) FindIdentityTagsByUserID(userID string) ([]model.IdentityTag, error) {
 	var tags []model.IdentityTag
-	err := r.db.Where(whereUserID, userID).Order(orderCreatedAtDesc).Find(&tags).Error
+	err := r.db.Where(whereUserID, userID).Order("tag_type").Order(orderCreatedAtDesc).Find(&tags).Error
 	return tags, err
 }
 
@@ -36,45 +38,81 @@ func (r *EchoRepo) DeleteIdentityTag(id, userID string) error {
 	return r.db.Where(whereIDAndUserID, id, userID).Delete(&model.IdentityTag{}).Error
 }
 
-func (r *EchoRepo) FindMemoirsByUserID(userID string, limit, offset int) ([]model.Memoir, int64, error) {
-	query := r.db.Model(&model.Memoir{}).Where(whereUserID, userID)
+type memoirWithTotal struct {
+	model.Memoir
+	Total int64 `gorm:"column:total"`
+}
 
-	var total int64
-	if err := query.Count(&total).Error; err != nil {
+// FindMemoirsByUserIDs returns one page of memoirs plus the overall count,
+// using COUNT(*) OVER() so both come back in a single round-trip.
+func (r *EchoRepo) FindMemoirsByUserIDs(userIDs []string, limit, offset int) ([]model.Memoir, int64, error) {
+	var rows []memoirWithTotal
+	err := r.db.Model(&model.Memoir{}).
+		Select("*, COUNT(*) OVER() AS total").
+		Where(whereUserIDIn, userIDs).
+		Order("created_at desc, id desc").Offset(offset).Limit(limit).
+		Scan(&rows).Error
+	if err != nil {
 		return nil, 0, err
 	}
 
-	var memoirs []model.Memoir
-	err := query.Order(orderCreatedAtDesc).Offset(offset).Limit(limit).Find(&memoirs).Error
-	return memoirs, total, err
-}
+	if len(rows) == 0 {
+		// A page past the end carries no window total; fall back to COUNT
+		var total int64
+		if offset > 0 {
+			if err := r.db.Model(&model.Memoir{}).Where(whereUserIDIn, userIDs).Count(&total).Error; err != nil {
+				return nil, 0, err
+			}
+		}
+		return []model.Memoir{}, total, nil
+	}
 
-func (r *EchoRepo) FindMemoirsByUserIDs(userIDs []string, limit, offset int) ([]model.Memoir, int64, error) {
-	query := r.db.Model(&model.Memoir{}).Where(whereUserIDIn, userIDs)
+	memoirs := make([]model.Memoir, len(rows))
+	for i := range rows {
+		memoirs[i] = rows[i].Memoir
+	}
+	return memoirs, rows[0].Total, nil
+}
 
-	var total int64
-	if err := query.Count(&total).Error; err != nil {
-		return nil, 0, err
+// FindMemoirsByUserIDsBefore returns the page of memoirs that sorts after the
+// memoir with ID before, seeking on (created_at, id) instead of skipping rows
+// with OFFSET; idx_memoirs_user_created_id serves the seek. The cursor must
+// belong to one of userIDs, otherwise gorm.ErrRecordNotFound is returned.
+// No total is computed: counting the family's memoirs on every page would
+// bring back the cost the cursor avoids.
+func (r *EchoRepo) FindMemoirsByUserIDsBefore(userIDs []string, before string, limit int) ([]model.Memoir, error) {
+	var cursor model.Memoir
+	err := r.db.Select("id", "created_at").
+		Where(whereUserIDIn, userIDs).Where("id = ?", before).
+		Take(&cursor).Error
+	if err != nil {
+		return nil, err
 	}
 
 	var memoirs []model.Memoir
-	err := query.Order(orderCreatedAtDesc).Offset(offset).Limit(limit).Find(&memoirs).Error
-	return memoirs, total, err
+	err = r.db.Where(whereUserIDIn, userIDs).
+		Where("(created_at, id) < (?, ?)", cursor.CreatedAt, cursor.ID).
+		Order("created_at desc, id desc").Limit(limit).
+		Find(&memoirs).Error
+	return memoirs, err
 }
 
 func (r *EchoRepo) CreateMemoir(memoir *model.Memoir) error {
 	return r.db.Create(memoir).Error
 }
 
-func (r *EchoRepo) FindMemoirByIDAndUserID(id, userID string) (*model.Memoir, error) {
+// RateMemoir sets user_rating on the owner's memoir with a single
+// UPDATE ... RETURNING and hands back the updated row.
+func (r *EchoRepo) RateMemoir(id, userID string, rating int) (*model.Memoir, error) {
 	var memoir model.Memoir
-	err := r.db.Where(whereIDAndUserID, id, userID).First(&memoir).Error
-	if err != nil {
-		return nil, err
+	res := r.db.Model(&memoir).Clauses(clause.Returning{}).
+		Where(whereIDAndUserID, id, userID).
+		Updates(map[string]any{"user_rating": rating})
+	if res.Error != nil {
+		return nil, res.Error
+	}
+	if res.RowsAffected == 0 {
+		return nil, gorm.ErrRecordNotFound
 	}
 	return &memoir, nil
 }
-
-func (r *EchoRepo) UpdateMemoir(memoir *model.Memoir) error {
-	return r.db.Save(memoir).Error
-}
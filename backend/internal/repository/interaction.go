@@ -51,8 +51,23 @@ func (r *InteractionRepo) DeleteLike(userID, targetType, targetID string) error
 		userID, targetType, targetID).Delete(&model.Like{}).Error
 }
 
-func (r *InteractionRepo) DeleteLikesByTarget(targetType, targetID string) error {
-	return r.db.Where("target_type = ? AND target_id = ?", targetType, targetID).Delete(&model.Like{}).Error
+// DeleteLikesByTarget deletes the likes on all the given targets in one statement.
+func (r *InteractionRepo) DeleteLikesByTarget(targetType string, targetIDs ...string) error {
+	if len(targetIDs) == 0 {
+		return nil
+	}
+	return r.db.Where("target_type = ? AND target_id IN ?", targetType, targetIDs).Delete(&model.Like{}).Error
+}
+
+// DeleteCommentLikesByAnswer deletes the likes on every comment under the
+// given answers, whatever the comment's status. It must run before the
+// comments themselves are deleted.
+func (r *InteractionRepo) DeleteCommentLikesByAnswer(answerIDs ...string) error {
+	if len(answerIDs) == 0 {
+		return nil
+	}
+	return r.db.Where("target_type = ? AND target_id IN (SELECT id FROM comments WHERE answer_id IN ?)",
+		"comment", answerIDs).Delete(&model.Like{}).Error
 }
 
 // Collection operations
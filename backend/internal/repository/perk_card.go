@@ -66,9 +66,13 @@ func (r *PerkCardRepo) MarkUsed(id string, usedAt time.Time) error {
 		}).Error
 }
 
-func (r *PerkCardRepo) MarkExpired(id string) error {
+// MarkExpired expires all the given cards with a single UPDATE.
+func (r *PerkCardRepo) MarkExpired(ids ...string) error {
+	if len(ids) == 0 {
+		return nil
+	}
 	return r.db.Model(&model.PerkCard{}).
-		Where("id = ?", id).
+		Where("id IN ?", ids).
 		Updates(map[string]interface{}{
 			"status": model.PerkExpired,
 		}).Error
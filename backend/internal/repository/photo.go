@@ -1,6 +1,7 @@
 package repository
 
 import (
+	"strings"
 	"time"
 
 	"github.com/momshell/backend/internal/model"
@@ -119,7 +120,10 @@ func (r *PhotoRepo) DeleteByID(id string) error {
 
 // FindAllPaginated returns all photos with optional filters for admin listing.
 func (r *PhotoRepo) FindAllPaginated(search, userID, source, onWall string, limit, offset int) ([]model.Photo, int64, error) {
-	query := r.db.Model(&model.Photo{}).Preload("User")
+	// The admin list only shows the owner's username
+	query := r.db.Model(&model.Photo{}).Preload("User", func(db *gorm.DB) *gorm.DB {
+		return db.Select("id", "username")
+	})
 
 	if search != "" {
 		like := "%" + search + "%"
@@ -198,15 +202,30 @@ func (r *PhotoRepo) BatchUpdateWallFamily(familyIDs []string, updates []WallUpda
 			Updates(map[string]any{"is_on_wall": false, "wall_position": nil}).Error; err != nil {
 			return err
 		}
-		for _, u := range updates {
-			pos := u.Position
-			if err := tx.Model(&model.Photo{}).
-				Where(whereIDAndUserIDIn, u.PhotoID, familyIDs).
-				Updates(map[string]any{"is_on_wall": true, "wall_position": pos}).Error; err != nil {
-				return err
-			}
+		if len(updates) == 0 {
+			return nil
 		}
-		return nil
+
+		// Place every photo with one UPDATE ... CASE instead of a statement per
+		// photo. WHEN arms are emitted in reverse so the last entry for a
+		// duplicated photo ID wins, as it did with sequential updates.
+		var position strings.Builder
+		position.WriteString("CASE id")
+		args := make([]any, 0, len(updates)*2)
+		ids := make([]string, 0, len(updates))
+		for i := len(updates) - 1; i >= 0; i-- {
+			position.WriteString(" WHEN ? THEN ?::int")
+			args = append(args, updates[i].PhotoID, updates[i].Position)
+			ids = append(ids, updates[i].PhotoID)
+		}
+		position.WriteString(" END")
+
+		return tx.Model(&model.Photo{}).
+			Where("id IN ? AND user_id IN ?", ids, familyIDs).
+			Updates(map[string]any{
+				"is_on_wall":    true,
+				"wall_position": gorm.Expr(position.String(), args...),
+			}).Error
 	})
 }
 
@@ -49,15 +49,30 @@ func (r *TagRepo) Delete(id string) error {
 	return r.db.Where(whereID, id).Delete(&model.Tag{}).Error
 }
 
-func (r *TagRepo) IncrementQuestionCount(id string) error {
-	return r.db.Model(&model.Tag{}).Where(whereID, id).
+// IncrementQuestionCount bumps question_count on every given tag in one UPDATE.
+func (r *TagRepo) IncrementQuestionCount(ids ...string) error {
+	if len(ids) == 0 {
+		return nil
+	}
+	return r.db.Model(&model.Tag{}).Where("id IN ?", ids).
 		UpdateColumn("question_count", gorm.Expr("question_count + 1")).Error
 }
 
 // QuestionTag operations
 
-func (r *TagRepo) CreateQuestionTag(qt *model.QuestionTag) error {
-	return r.db.Create(qt).Error
+// CreateQuestionTags links the question to the given tags with a single
+// INSERT ... SELECT. IDs that match no tag, or are already linked, are
+// skipped rather than failing the batch. It returns the tag IDs it linked.
+func (r *TagRepo) CreateQuestionTags(questionID string, tagIDs []string) ([]string, error) {
+	if len(tagIDs) == 0 {
+		return nil, nil
+	}
+	var linked []string
+	err := r.db.Raw(`INSERT INTO question_tags (question_id, tag_id, created_at)
+		SELECT ?, id, NOW() FROM tags WHERE id IN ?
+		ON CONFLICT DO NOTHING
+		RETURNING tag_id`, questionID, tagIDs).Scan(&linked).Error
+	return linked, err
 }
 
 func (r *TagRepo) DeleteQuestionTags(questionID string) error {
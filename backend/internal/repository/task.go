@@ -1,19 +1,30 @@
 package repository
 
 import (
+	"sync"
 	"time"
 
 	"github.com/momshell/backend/internal/model"
 	"gorm.io/gorm"
+	"gorm.io/gorm/clause"
 	"gorm.io/gorm/logger"
 )
 
 type TaskRepo struct {
 	db *gorm.DB
+	// quiet is a reusable session that doesn't log; AI cache misses are
+	// expected, so their "record not found" errors are not worth a log line.
+	quiet *gorm.DB
+	// templates caches DailyTask rows by ID. Templates are never updated
+	// after seeding, so a cached row cannot go stale.
+	templates sync.Map // id -> model.DailyTask
 }
 
 func NewTaskRepo(db *gorm.DB) *TaskRepo {
-	return &TaskRepo{db: db}
+	return &TaskRepo{
+		db:    db,
+		quiet: db.Session(&gorm.Session{Logger: db.Logger.LogMode(logger.Silent)}),
+	}
 }
 
 // DailyTask template operations
@@ -34,16 +45,46 @@ func (r *TaskRepo) FindRandomTemplates(count int) ([]model.DailyTask, error) {
 	return tasks, err
 }
 
+// findTemplate returns the template with the given ID, querying the
+// database only the first time an ID is seen.
+func (r *TaskRepo) findTemplate(id string) (*model.DailyTask, error) {
+	if v, ok := r.templates.Load(id); ok {
+		tmpl := v.(model.DailyTask)
+		return &tmpl, nil
+	}
+	var tmpl model.DailyTask
+	if err := r.db.First(&tmpl, whereID, id).Error; err != nil {
+		return nil, err
+	}
+	r.templates.Store(id, tmpl)
+	return &tmpl, nil
+}
+
+// attachTemplate fills in task.Task for legacy template tasks.
+func (r *TaskRepo) attachTemplate(task *model.UserTask) {
+	if task.TaskID == nil {
+		return
+	}
+	if tmpl, err := r.findTemplate(*task.TaskID); err == nil {
+		task.Task = tmpl
+	}
+}
+
 // UserTask operations
 
-func (r *TaskRepo) CreateUserTask(ut *model.UserTask) error {
-	return r.db.Create(ut).Error
+// CreateUserTasks inserts all tasks in a single multi-row INSERT.
+func (r *TaskRepo) CreateUserTasks(tasks []model.UserTask) error {
+	if len(tasks) == 0 {
+		return nil
+	}
+	return r.db.Create(&tasks).Error
 }
 
-func (r *TaskRepo) FindUserTasksByDate(userID string, date time.Time) ([]model.UserTask, error) {
+// FindWhisperTasksByDate returns the user's whisper-driven tasks for a day.
+// They carry their own content, so no template is preloaded.
+func (r *TaskRepo) FindWhisperTasksByDate(userID string, date time.Time) ([]model.UserTask, error) {
 	var tasks []model.UserTask
-	err := r.db.Preload("Task").
-		Where("user_id = ? AND date = ?", userID, date.Format("2006-01-02")).
+	err := r.db.Where("user_id = ? AND date = ? AND source = ?", userID, date.Format("2006-01-02"), model.TaskSourceWhisper).
 		Order("created_at asc").
 		Find(&tasks).Error
 	return tasks, err
@@ -51,10 +92,11 @@ func (r *TaskRepo) FindUserTasksByDate(userID string, date time.Time) ([]model.U
 
 func (r *TaskRepo) FindUserTaskByID(id string) (*model.UserTask, error) {
 	var task model.UserTask
-	err := r.db.Preload("Task").Preload("User").First(&task, "id = ?", id).Error
+	err := r.db.First(&task, "id = ?", id).Error
 	if err != nil {
 		return nil, err
 	}
+	r.attachTemplate(&task)
 	return &task, nil
 }
 
@@ -62,16 +104,37 @@ func (r *TaskRepo) UpdateUserTask(ut *model.UserTask) error {
 	return r.db.Save(ut).Error
 }
 
-// ResetUserTaskToPending clears completed_at and sets status back to pending.
-func (r *TaskRepo) ResetUserTaskToPending(ut *model.UserTask) error {
-	return r.db.Model(ut).
-		Select("status", "completed_at", "comment", "proof_photo_url").
-		Updates(map[string]interface{}{
-			"status":          ut.Status,
-			"completed_at":    nil,
-			"comment":         ut.Comment,
-			"proof_photo_url": nil,
-		}).Error
+// TransitionUserTask applies updates to the task only while it belongs to
+// userID and is in status from, returning the updated row via RETURNING.
+// It reports gorm.ErrRecordNotFound when no row matched. Legacy template
+// tasks get their template from the template cache.
+func (r *TaskRepo) TransitionUserTask(id, userID string, from model.TaskStatus, updates map[string]any) (*model.UserTask, error) {
+	return r.transitionTask(updates, "id = ? AND user_id = ? AND status = ?", id, userID, from)
+}
+
+// TransitionPartnerTask is TransitionUserTask for a task owned by the
+// partner of mom momID. The partner is resolved inside the UPDATE, so the
+// caller needs no separate lookup first.
+func (r *TaskRepo) TransitionPartnerTask(id, momID string, from model.TaskStatus, updates map[string]any) (*model.UserTask, error) {
+	return r.transitionTask(updates,
+		"id = ? AND status = ? AND user_id = (SELECT partner_id FROM users WHERE id = ? AND role = ?)",
+		id, from, momID, model.RoleMom)
+}
+
+func (r *TaskRepo) transitionTask(updates map[string]any, query string, args ...any) (*model.UserTask, error) {
+	var task model.UserTask
+	res := r.db.Model(&task).Clauses(clause.Returning{}).
+		Where(query, args...).
+		Updates(updates)
+	if res.Error != nil {
+		return nil, res.Error
+	}
+	if res.RowsAffected == 0 {
+		return nil, gorm.ErrRecordNotFound
+	}
+
+	r.attachTemplate(&task)
+	return &task, nil
 }
 
 func (r *TaskRepo) SumScoreByUserID(userID string) (int, error) {
@@ -100,29 +163,45 @@ func (r *TaskRepo) CountVerifiedTasksByUserID(userID string) (int, error) {
 	return int(count), nil
 }
 
-func (r *TaskRepo) FindVerifiedTasksByUserID(userID string) ([]model.UserTask, error) {
-	var tasks []model.UserTask
-	err := r.db.Preload("Task").
-		Where("user_id = ? AND status = ? AND score IS NOT NULL", userID, model.TaskVerified).
-		Order("scored_at asc").
-		Find(&tasks).Error
-	return tasks, err
+// CategoryScore is a user's summed verified score for one task category.
+type CategoryScore struct {
+	Category string `gorm:"column:task_category"`
+	Total    int
+}
+
+// SumVerifiedScoresByCategory aggregates verified scores per task category in
+// SQL. AI and whisper tasks carry their own category; template tasks take it
+// from daily_tasks.
+func (r *TaskRepo) SumVerifiedScoresByCategory(userID string) ([]CategoryScore, error) {
+	var scores []CategoryScore
+	err := r.db.Table("user_tasks AS ut").
+		Select(`COALESCE(CASE WHEN COALESCE(ut.source, '') <> ? THEN LOWER(TRIM(ut.ai_category))
+			ELSE dt.category END, '') AS task_category, SUM(ut.score) AS total`, model.TaskSourceTemplate).
+		Joins("LEFT JOIN daily_tasks dt ON dt.id = ut.task_id").
+		Where("ut.user_id = ? AND ut.status = ? AND ut.score IS NOT NULL", userID, model.TaskVerified).
+		Group("task_category").
+		Scan(&scores).Error
+	return scores, err
 }
 
 // AI cache operations
 
 func (r *TaskRepo) FindAICache(coupleKey, date, cacheType string) (*model.AIGeneratedTask, error) {
 	var cache model.AIGeneratedTask
-	err := r.db.Session(&gorm.Session{Logger: r.db.Logger.LogMode(logger.Silent)}).
-		Where("couple_key = ? AND date = ? AND type = ?", coupleKey, date, cacheType).First(&cache).Error
+	err := r.quiet.Where("couple_key = ? AND date = ? AND type = ?", coupleKey, date, cacheType).First(&cache).Error
 	if err != nil {
 		return nil, err
 	}
 	return &cache, nil
 }
 
+// SaveAICache stores the cache entry, replacing the content of an existing
+// entry for the same couple, date and type in the same statement.
 func (r *TaskRepo) SaveAICache(cache *model.AIGeneratedTask) error {
-	return r.db.Create(cache).Error
+	return r.db.Clauses(clause.OnConflict{
+		Columns:   []clause.Column{{Name: "couple_key"}, {Name: "date"}, {Name: "type"}},
+		DoUpdates: clause.AssignmentColumns([]string{"age_stage", "tasks_json"}),
+	}).Create(cache).Error
 }
 
 func (r *TaskRepo) DeleteAICacheByCouple(coupleKey, date, cacheType string) error {
@@ -62,15 +62,88 @@ func (r *UserRepo) ExistsByEmail(email, excludeUserID string) (bool, error) {
 	return count > 0, err
 }
 
-func (r *UserRepo) FindByShellCode(code string) (*model.User, error) {
+// FindByIDOrShellCode loads a user and the owner of a shell code in a single
+// query. Either result is nil when nothing matches; both may be the same row.
+func (r *UserRepo) FindByIDOrShellCode(id, code string) (user, owner *model.User, err error) {
+	var users []model.User
+	if err = r.db.Where("id = ? OR shell_code = ?", id, code).Limit(2).Find(&users).Error; err != nil {
+		return nil, nil, err
+	}
+	for i := range users {
+		if users[i].ID == id {
+			user = &users[i]
+		}
+		if users[i].ShellCode != nil && *users[i].ShellCode == code {
+			owner = &users[i]
+		}
+	}
+	return user, owner, nil
+}
+
+// FindFamily returns the user and, when bound, their partner in one query.
+// Only id, nickname and partner_id are loaded.
+func (r *UserRepo) FindFamily(id string) ([]model.User, error) {
+	var users []model.User
+	err := r.db.Select("id", "nickname", "partner_id").
+		Where("id = ? OR id = (SELECT partner_id FROM users WHERE id = ?)", id, id).
+		Find(&users).Error
+	return users, err
+}
+
+// FindBinding loads only id, role and partner_id, which is all the partner
+// features need to authorize a request. It skips FindByID's certification
+// preload, saving a query on every call.
+func (r *UserRepo) FindBinding(id string) (*model.User, error) {
 	var user model.User
-	err := r.db.Where("shell_code = ?", code).First(&user).Error
+	err := r.db.Select("id", "role", "partner_id").First(&user, whereID, id).Error
 	if err != nil {
 		return nil, err
 	}
 	return &user, nil
 }
 
+// FindWithPartner loads a user and, when bound, their partner in one query,
+// with certifications preloaded for both. partner is nil for an unbound
+// user; a missing user reports gorm.ErrRecordNotFound.
+func (r *UserRepo) FindWithPartner(id string) (user, partner *model.User, err error) {
+	var users []model.User
+	err = r.db.Preload(preloadCertification).
+		Where("id = ? OR id = (SELECT partner_id FROM users WHERE id = ?)", id, id).
+		Limit(2).Find(&users).Error
+	if err != nil {
+		return nil, nil, err
+	}
+	for i := range users {
+		if users[i].ID == id {
+			user = &users[i]
+		} else {
+			partner = &users[i]
+		}
+	}
+	if user == nil {
+		return nil, nil, gorm.ErrRecordNotFound
+	}
+	return user, partner, nil
+}
+
+// UnbindPartner clears partner_id and shell_code on the user and their
+// partner in one UPDATE. It affects no rows when the user is not bound.
+func (r *UserRepo) UnbindPartner(id string) (int64, error) {
+	res := r.db.Model(&model.User{}).
+		Where(`id IN (SELECT id FROM users WHERE id = @uid AND partner_id IS NOT NULL
+			UNION SELECT partner_id FROM users WHERE id = @uid)`, map[string]any{"uid": id}).
+		Updates(map[string]any{"partner_id": nil, "shell_code": nil})
+	return res.RowsAffected, res.Error
+}
+
+// SetShellCodeIfAbsent stores code as the user's shell code unless one is
+// already set, in which case the existing code is left untouched.
+func (r *UserRepo) SetShellCodeIfAbsent(id, code string) error {
+	return r.db.Model(&model.User{}).
+		Where("id = ? AND shell_code IS NULL", id).
+		Update("shell_code", code).Error
+}
+
 func (r *UserRepo) Create(user *model.User) error {
 	return r.db.Create(user).Error
 }
@@ -5,18 +5,23 @@ import (
 	"errors"
 	"log"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/momshell/backend/internal/dto"
 	"github.com/momshell/backend/internal/model"
 	"github.com/momshell/backend/internal/repository"
-	"gorm.io/gorm"
 )
 
 type AchievementService struct {
 	taskRepo        *repository.TaskRepo
 	achievementRepo *repository.AchievementRepo
 	userRepo        *repository.UserRepo
+
+	// The catalog is only written by startup seeding, so it is loaded once
+	// and shared read-only by every request.
+	catalogMu sync.Mutex
+	catalog   []model.Achievement
 }
 
 func NewAchievementService(
@@ -31,8 +36,24 @@ func NewAchievementService(
 	}
 }
 
+// achievements returns the cached achievement catalog, loading it on first
+// use. A failed load is not cached, so the next call retries.
+func (s *AchievementService) achievements() ([]model.Achievement, error) {
+	s.catalogMu.Lock()
+	defer s.catalogMu.Unlock()
+	if s.catalog != nil {
+		return s.catalog, nil
+	}
+	all, err := s.achievementRepo.FindAll()
+	if err != nil {
+		return nil, err
+	}
+	s.catalog = all
+	return all, nil
+}
+
 func (s *AchievementService) GetSkillRadar(callerID string) (*dto.SkillRadar, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return &dto.SkillRadar{}, errors.New(errUserNotFound)
 	}
@@ -45,16 +66,16 @@ func (s *AchievementService) GetSkillRadar(callerID string) (*dto.SkillRadar, er
 		targetID = *user.PartnerID
 	}
 
-	tasks, err := s.taskRepo.FindVerifiedTasksByUserID(targetID)
+	scores, err := s.taskRepo.SumVerifiedScoresByCategory(targetID)
 	if err != nil {
 		return nil, err
 	}
-	radar := computeSkillRadar(tasks)
+	radar := computeSkillRadar(scores)
 	return &radar, nil
 }
 
 func (s *AchievementService) GetAchievements(callerID string) ([]dto.AchievementItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -67,7 +88,7 @@ func (s *AchievementService) GetAchievements(callerID string) ([]dto.Achievement
 		targetID = *user.PartnerID
 	}
 
-	all, err := s.achievementRepo.FindAll()
+	all, err := s.achievements()
 	if err != nil {
 		return nil, err
 	}
@@ -105,7 +126,7 @@ func (s *AchievementService) GetAchievements(callerID string) ([]dto.Achievement
 
 // CheckAndUnlock evaluates all achievements for the given user and unlocks the missing ones.
 func (s *AchievementService) CheckAndUnlock(userID string) error {
-	all, err := s.achievementRepo.FindAll()
+	all, err := s.achievements()
 	if err != nil {
 		return err
 	}
@@ -123,12 +144,13 @@ func (s *AchievementService) CheckAndUnlock(userID string) error {
 	if err != nil {
 		return err
 	}
-	verifiedTasks, err := s.taskRepo.FindVerifiedTasksByUserID(userID)
+	scores, err := s.taskRepo.SumVerifiedScoresByCategory(userID)
 	if err != nil {
 		return err
 	}
-	radar := computeSkillRadar(verifiedTasks)
+	radar := computeSkillRadar(scores)
 
+	var newlyUnlocked []model.UserAchievement
 	for _, a := range all {
 		if unlockedSet[a.ID] {
 			continue
@@ -139,23 +161,16 @@ func (s *AchievementService) CheckAndUnlock(userID string) error {
 		}
 
 		if isConditionSatisfied(cond, verifiedCount, radar) {
-			ua := &model.UserAchievement{
+			newlyUnlocked = append(newlyUnlocked, model.UserAchievement{
 				UserID:        userID,
 				AchievementID: a.ID,
-			}
-			if err := s.achievementRepo.CreateUserAchievement(ua); err != nil {
-				// Unique index makes this idempotent; ignore duplicates
-				if errors.Is(err, gorm.ErrDuplicatedKey) ||
-					strings.Contains(strings.ToLower(err.Error()), "duplicate") ||
-					strings.Contains(strings.ToLower(err.Error()), "unique") {
-					continue
-				}
-				log.Printf("[Achievement] unlock failed for %s/%s: %v", userID, a.Code, err)
-				continue
-			}
+			})
 		}
 	}
 
+	if err := s.achievementRepo.CreateUserAchievements(newlyUnlocked); err != nil {
+		log.Printf("[Achievement] unlock failed for %s: %v", userID, err)
+	}
 	return nil
 }
 
@@ -165,7 +180,27 @@ type achievementCondition struct {
 	Dimension string `json:"dimension"`
 }
 
+// parsedConditions memoizes parseAchievementCondition by raw JSON. The
+// achievement catalog is tiny and fixed, so every unlock check after the
+// first skips json.Unmarshal entirely.
+var parsedConditions sync.Map // raw string -> parsedCondition
+
+type parsedCondition struct {
+	cond achievementCondition
+	ok   bool
+}
+
 func parseAchievementCondition(raw string) (achievementCondition, bool) {
+	if v, hit := parsedConditions.Load(raw); hit {
+		p := v.(parsedCondition)
+		return p.cond, p.ok
+	}
+	cond, ok := decodeAchievementCondition(raw)
+	parsedConditions.Store(raw, parsedCondition{cond: cond, ok: ok})
+	return cond, ok
+}
+
+func decodeAchievementCondition(raw string) (achievementCondition, bool) {
 	raw = strings.TrimSpace(raw)
 	if raw == "" {
 		return achievementCondition{}, false
@@ -175,7 +210,7 @@ func parseAchievementCondition(raw string) (achievementCondition, bool) {
 		return achievementCondition{}, false
 	}
 	cond.Type = strings.TrimSpace(cond.Type)
-	cond.Dimension = strings.TrimSpace(cond.Dimension)
+	cond.Dimension = strings.ToLower(strings.TrimSpace(cond.Dimension))
 	if cond.Min <= 0 || cond.Type == "" {
 		return achievementCondition{}, false
 	}
@@ -187,18 +222,19 @@ func isConditionSatisfied(cond achievementCondition, verifiedCount int, radar dt
 	case "task_count":
 		return verifiedCount >= cond.Min
 	case "dimension_min":
-		switch strings.ToLower(cond.Dimension) {
-		case string(model.SkillNutrition):
+		// Dimension is lower-cased once when the condition is parsed
+		switch model.SkillDimension(cond.Dimension) {
+		case model.SkillNutrition:
 			return radar.Nutrition >= cond.Min
-		case string(model.SkillCleaning):
+		case model.SkillCleaning:
 			return radar.Cleaning >= cond.Min
-		case string(model.SkillEmotional):
+		case model.SkillEmotional:
 			return radar.Emotional >= cond.Min
-		case string(model.SkillLogistics):
+		case model.SkillLogistics:
 			return radar.Logistics >= cond.Min
-		case string(model.SkillHealth):
+		case model.SkillHealth:
 			return radar.Health >= cond.Min
-		case string(model.SkillPlaytime):
+		case model.SkillPlaytime:
 			return radar.Playtime >= cond.Min
 		default:
 			return false
@@ -208,42 +244,27 @@ func isConditionSatisfied(cond achievementCondition, verifiedCount int, radar dt
 	}
 }
 
-func computeSkillRadar(tasks []model.UserTask) dto.SkillRadar {
+func computeSkillRadar(scores []repository.CategoryScore) dto.SkillRadar {
 	var radar dto.SkillRadar
 
-	for _, ut := range tasks {
-		if ut.Score == nil {
-			continue
-		}
-		score := *ut.Score
-		cat := resolveUserTaskCategory(ut)
-		switch cat {
+	for _, cs := range scores {
+		switch cs.Category {
 		case string(model.TaskCategoryHousework):
-			radar.Cleaning += score
-			radar.Logistics += score
+			radar.Cleaning += cs.Total
+			radar.Logistics += cs.Total
 		case string(model.TaskCategoryParenting):
-			radar.Nutrition += score
-			radar.Playtime += score
+			radar.Nutrition += cs.Total
+			radar.Playtime += cs.Total
 		case string(model.TaskCategoryHealth):
-			radar.Health += score
+			radar.Health += cs.Total
 		case string(model.TaskCategoryEmotional):
-			radar.Emotional += score
+			radar.Emotional += cs.Total
 		}
 	}
 
 	return radar
 }
 
-func resolveUserTaskCategory(ut model.UserTask) string {
-	if ut.Source != model.TaskSourceTemplate {
-		return strings.ToLower(strings.TrimSpace(ut.AICategory))
-	}
-	if ut.Task != nil {
-		return string(ut.Task.Category)
-	}
-	return ""
-}
-
 type timePair struct {
 	t  time.Time
 	ok bool
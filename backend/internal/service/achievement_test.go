@@ -5,6 +5,7 @@ import (
 
 	"github.com/momshell/backend/internal/dto"
 	"github.com/momshell/backend/internal/model"
+	"github.com/momshell/backend/internal/repository"
 )
 
 func TestParseAchievementCondition(t *testing.T) {
@@ -43,6 +44,21 @@ func TestParseAchievementCondition(t *testing.T) {
 	}
 }
 
+func TestParseAchievementConditionMemoized(t *testing.T) {
+	raw := `{"type":"dimension_min","min":4,"dimension":"playtime"}`
+	first, ok := parseAchievementCondition(raw)
+	if !ok {
+		t.Fatalf("parseAchievementCondition(%q) ok = false", raw)
+	}
+	if _, hit := parsedConditions.Load(raw); !hit {
+		t.Fatalf("condition %q was not memoized", raw)
+	}
+	second, ok := parseAchievementCondition(raw)
+	if !ok || second != first {
+		t.Errorf("memoized parse = %+v, %v; want %+v, true", second, ok, first)
+	}
+}
+
 func TestIsConditionSatisfied(t *testing.T) {
 	radar := dto.SkillRadar{
 		Nutrition: 10, Cleaning: 5, Emotional: 8,
@@ -73,18 +89,16 @@ func TestIsConditionSatisfied(t *testing.T) {
 	}
 }
 
-func intPtr(v int) *int { return &v }
-
 func TestComputeSkillRadar(t *testing.T) {
-	tasks := []model.UserTask{
-		{AICategory: "housework", Source: model.TaskSourceAI, Score: intPtr(3)},
-		{AICategory: "parenting", Source: model.TaskSourceAI, Score: intPtr(5)},
-		{AICategory: "health", Source: model.TaskSourceAI, Score: intPtr(4)},
-		{AICategory: "emotional", Source: model.TaskSourceAI, Score: intPtr(2)},
-		{AICategory: "health", Source: model.TaskSourceAI, Score: nil}, // skipped
+	scores := []repository.CategoryScore{
+		{Category: "housework", Total: 3},
+		{Category: "parenting", Total: 5},
+		{Category: "health", Total: 4},
+		{Category: "emotional", Total: 2},
+		{Category: "", Total: 9}, // unknown category ignored
 	}
 
-	radar := computeSkillRadar(tasks)
+	radar := computeSkillRadar(scores)
 
 	if radar.Cleaning != 3 || radar.Logistics != 3 {
 		t.Errorf("housework: cleaning=%d logistics=%d, want 3,3", radar.Cleaning, radar.Logistics)
@@ -99,23 +113,3 @@ func TestComputeSkillRadar(t *testing.T) {
 		t.Errorf("emotional=%d, want 2", radar.Emotional)
 	}
 }
-
-func TestResolveUserTaskCategory(t *testing.T) {
-	tests := []struct {
-		name string
-		ut   model.UserTask
-		want string
-	}{
-		{name: "AI source uses AICategory", ut: model.UserTask{Source: model.TaskSourceAI, AICategory: " Health "}, want: "health"},
-		{name: "template with task", ut: model.UserTask{Source: model.TaskSourceTemplate, Task: &model.DailyTask{Category: model.TaskCategoryHousework}}, want: string(model.TaskCategoryHousework)},
-		{name: "template without task", ut: model.UserTask{Source: model.TaskSourceTemplate}, want: ""},
-	}
-
-	for _, tc := range tests {
-		t.Run(tc.name, func(t *testing.T) {
-			if got := resolveUserTaskCategory(tc.ut); got != tc.want {
-				t.Errorf("resolveUserTaskCategory() = %q, want %q", got, tc.want)
-			}
-		})
-	}
-}
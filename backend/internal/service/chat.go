@@ -235,25 +235,27 @@ func NewChatService(client *openai.Client, chatRepo *repository.ChatRepo, userRe
 	}
 }
 
-func (s *ChatService) getFamilyIDs(userID string) []string {
-	user, err := s.userRepo.FindByID(userID)
+// getFamily returns the caller's family IDs (caller first) and their
+// nicknames, resolved with a single query.
+func (s *ChatService) getFamily(userID string) ([]string, map[string]string) {
+	ids := []string{userID}
+	nicknames := make(map[string]string, 2)
+	users, err := s.userRepo.FindFamily(userID)
 	if err != nil {
-		return []string{userID}
+		return ids, nicknames
 	}
-	if user.PartnerID != nil && *user.PartnerID != "" {
-		return []string{userID, *user.PartnerID}
+	for _, u := range users {
+		nicknames[u.ID] = u.Nickname
+		if u.ID != userID {
+			ids = append(ids, u.ID)
+		}
 	}
-	return []string{userID}
+	return ids, nicknames
 }
 
-func (s *ChatService) buildNicknameMap(familyIDs []string) map[string]string {
-	m := make(map[string]string, len(familyIDs))
-	for _, id := range familyIDs {
-		if u, err := s.userRepo.FindByID(id); err == nil {
-			m[id] = u.Nickname
-		}
-	}
-	return m
+func (s *ChatService) getFamilyIDs(userID string) []string {
+	ids, _ := s.getFamily(userID)
+	return ids
 }
 
 func (s *ChatService) Chat(ctx context.Context, msg dto.UserMessage, userID string) (*dto.VisualResponse, error) {
@@ -279,6 +281,24 @@ func appendRAGResults(systemPrompt, ragContext string) string {
 	return systemPrompt + "\n\n## 社区内容与个人历史参考\n" + ragContext + "\n你可以参考这些信息来提供更具个性化和深度的回答。如果是个人历史信息，可以自然地融入对话。"
 }
 
+// gatherReferences runs the web search and the vector search (RAG) for a
+// chat message concurrently. Both are network-bound and independent, so the
+// turn waits for the slower of the two instead of their sum.
+func (s *ChatService) gatherReferences(ctx context.Context, query string, userID *string) (webResults, ragContext string) {
+	var wg sync.WaitGroup
+	if s.ragService != nil {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			ragResults, _ := s.ragService.Search(ctx, query, userID)
+			ragContext = s.ragService.FormatContext(ragResults)
+		}()
+	}
+	webResults = s.searchWebForChat(ctx, query)
+	wg.Wait()
+	return webResults, ragContext
+}
+
 // chatUserContext holds resolved user context for authenticated chat.
 type chatUserContext struct {
 	role        model.UserRole
@@ -306,6 +326,15 @@ func (s *ChatService) resolveChatUserContext(userID string) chatUserContext {
 }
 
 func (s *ChatService) chatAuthenticated(ctx context.Context, msg dto.UserMessage, userID string) (*dto.VisualResponse, error) {
+	// Web and RAG lookups only need the message, so they run while the user,
+	// memory and facts are read from the DB below.
+	var webResults, ragContext string
+	referencesDone := make(chan struct{})
+	go func() {
+		defer close(referencesDone)
+		webResults, ragContext = s.gatherReferences(ctx, msg.Content, &userID)
+	}()
+
 	// Look up user role and partner info
 	uc := s.resolveChatUserContext(userID)
 	pronoun := pronounFor(uc.role)
@@ -326,26 +355,13 @@ func (s *ChatService) chatAuthenticated(ctx context.Context, msg dto.UserMessage
 		formatTurns(turns, summary, pronoun),
 	)
 
-	// Update memory section header for family mode
-	if uc.partnerID != "" {
-		for _, old := range []string{"你记得关于她的重要信息", "你记得关于他的重要信息", "你记得关于对方的重要信息"} {
-			systemPrompt = strings.Replace(systemPrompt, old, "你记得关于这个家庭的重要信息", 1)
-		}
-	}
-
 	if deletedFactsText != "" {
 		systemPrompt += "\n\n### 已删除的记忆（用户已删除或更正，请勿重新记录）\n" + deletedFactsText
 	}
 
-	webResults := s.searchWebForChat(ctx, msg.Content)
+	<-referencesDone
 	systemPrompt = appendWebSearchResults(systemPrompt, webResults)
-
-	// Perform Vector Search (RAG)
-	if s.ragService != nil {
-		ragResults, _ := s.ragService.Search(ctx, msg.Content, &userID)
-		ragContext := s.ragService.FormatContext(ragResults)
-		systemPrompt = appendRAGResults(systemPrompt, ragContext)
-	}
+	systemPrompt = appendRAGResults(systemPrompt, ragContext)
 
 	messages := []openai.Message{
 		{Role: "system", Content: systemPrompt},
@@ -468,15 +484,9 @@ func (s *ChatService) chatGuest(ctx context.Context, msg dto.UserMessage) (*dto.
 		formatTurns(turns, "", "她"),
 	)
 
-	webResults := s.searchWebForChat(ctx, msg.Content)
+	webResults, ragContext := s.gatherReferences(ctx, msg.Content, nil)
 	systemPrompt = appendWebSearchResults(systemPrompt, webResults)
-
-	// Perform Vector Search (RAG)
-	if s.ragService != nil {
-		ragResults, _ := s.ragService.Search(ctx, msg.Content, nil)
-		ragContext := s.ragService.FormatContext(ragResults)
-		systemPrompt = appendRAGResults(systemPrompt, ragContext)
-	}
+	systemPrompt = appendRAGResults(systemPrompt, ragContext)
 
 	messages := []openai.Message{
 		{Role: "system", Content: systemPrompt},
@@ -595,15 +605,9 @@ func (s *ChatService) generateAndSaveSummary(userID string, existingSummary stri
 
 	newSummary = strings.TrimSpace(newSummary)
 
-	// Load current memory to get latest turns (may have changed since goroutine started)
-	mem, err := s.chatRepo.FindByUserID(userID)
-	if err != nil {
-		log.Printf("[ChatService] failed to load memory for summary update user %s: %v", userID, err)
-		return
-	}
-
-	mem.SetSummary(newSummary)
-	if err := s.chatRepo.UpdateSummaryAndTurns(userID, newSummary, mem.ConversationTurns); err != nil {
+	// Write the summary column alone: the turns may have moved on since this
+	// goroutine started, and rewriting them would need a read first
+	if err := s.chatRepo.UpdateSummary(userID, newSummary); err != nil {
 		log.Printf("[ChatService] failed to save summary for user %s: %v", userID, err)
 	}
 }
@@ -626,27 +630,18 @@ func parseFactItem(v interface{}) (content, aiCategory string) {
 
 // saveSingleFact creates a fact if it does not already exist. Returns true if saved.
 func (s *ChatService) saveSingleFact(userID, content, aiCategory string) bool {
-	exists, err := s.chatRepo.FactExistsByContent(userID, content)
-	if err != nil {
-		log.Printf("[ChatService] failed to check fact existence: %v", err)
-		return false
-	}
-	if exists {
-		return false
-	}
-
-	category := resolveFactCategory(aiCategory, content)
 	fact := &model.ChatMemoryFact{
 		UserID:      userID,
 		OwnerUserID: userID,
 		Content:     content,
-		Category:    category,
+		Category:    resolveFactCategory(aiCategory, content),
 	}
-	if err := s.chatRepo.CreateFact(fact); err != nil {
+	saved, err := s.chatRepo.CreateFactIfAbsent(fact)
+	if err != nil {
 		log.Printf("[ChatService] failed to save fact for user %s: %v", userID, err)
 		return false
 	}
-	return true
+	return saved
 }
 
 func (s *ChatService) saveFactsFromExtract(userID string, extract interface{}) bool {
@@ -834,10 +829,10 @@ func (s *ChatService) loadFactsForPrompt(userID string, familyIDs []string, user
 
 	// Deleted facts in family scope (prevent re-learning)
 	var deletedSB strings.Builder
-	deletedFacts, err := s.chatRepo.FindDeletedFactsByFamilyIDs(familyIDs)
+	deletedContents, err := s.chatRepo.FindDeletedFactContentsByFamilyIDs(familyIDs)
 	if err == nil {
-		for _, f := range deletedFacts {
-			fmt.Fprintf(&deletedSB, "- %s\n", f.Content)
+		for _, content := range deletedContents {
+			fmt.Fprintf(&deletedSB, "- %s\n", content)
 		}
 	}
 
@@ -846,8 +841,7 @@ func (s *ChatService) loadFactsForPrompt(userID string, familyIDs []string, user
 
 // GetMemories returns all structured memory facts for the family (Phase 3 API).
 func (s *ChatService) GetMemories(userID string) (*dto.ChatMemoryFactsResponse, error) {
-	familyIDs := s.getFamilyIDs(userID)
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	familyIDs, nicknameMap := s.getFamily(userID)
 
 	facts, err := s.chatRepo.FindFactsByFamilyIDs(familyIDs)
 	if err != nil {
@@ -926,8 +920,21 @@ func (s *ChatService) ClearConversationHistory(userID string) error {
 
 // --- Existing helpers (updated) ---
 
+// Small talk never needs grounding, and on most turns it is all the user
+// sends. chatSmallTalkPattern matches whole-message greetings, thanks and
+// sighs; everything else is searched, since short messages are often bare
+// topics ("盆底肌修复") that need the search most.
+var chatSmallTalkPattern = regexp.MustCompile(`(?i)^(你好|您好|hi|hello|嗨|嗯+|哦+|好的?|谢谢|谢啦|晚安|早安|早上好|晚上好|我好累|好累|累死了|哈+)[\s!！。.~～?？]*$`)
+
+// needsWebSearch reports whether a chat message is worth a Firecrawl search.
+// It only skips messages that are nothing but small talk.
+func needsWebSearch(message string) bool {
+	message = strings.TrimSpace(message)
+	return message != "" && !chatSmallTalkPattern.MatchString(message)
+}
+
 func (s *ChatService) searchWebForChat(ctx context.Context, userMessage string) string {
-	if s.firecrawl == nil {
+	if s.firecrawl == nil || !needsWebSearch(userMessage) {
 		return ""
 	}
 	results, err := s.firecrawl.Search(ctx, userMessage, 3)
@@ -944,14 +951,7 @@ func (s *ChatService) searchWebForChat(ctx context.Context, userMessage string)
 		if !strings.HasPrefix(r.URL, "https://") && !strings.HasPrefix(r.URL, "http://") {
 			continue
 		}
-		content := r.Markdown
-		if content == "" {
-			content = r.Description
-		}
-		if len([]rune(content)) > 300 {
-			content = string([]rune(content)[:300]) + "..."
-		}
-		fmt.Fprintf(&sb, "来源「%s」（%s）：%s\n", r.Title, r.URL, content)
+		fmt.Fprintf(&sb, "来源「%s」（%s）：%s\n", r.Title, r.URL, searchResultSnippet(r, 300))
 	}
 	return sb.String()
 }
@@ -1009,61 +1009,64 @@ func (s *ChatService) saveUserMemory(userID string, profile map[string]interface
 	}
 }
 
-// formatSliceField formats a profile slice field (e.g. interests, concerns) as a comma-separated line.
-func formatSliceField(profile map[string]interface{}, key string, label string) string {
+// writeSliceField writes a profile slice field (e.g. interests, concerns) as a comma-separated line.
+func writeSliceField(sb *strings.Builder, profile map[string]interface{}, key string, label string) {
 	items, ok := profile[key].([]interface{})
 	if !ok || len(items) == 0 {
-		return ""
+		return
 	}
-	var sb strings.Builder
 	sb.WriteString(label)
 	for i, v := range items {
 		if i > 0 {
 			sb.WriteString(", ")
 		}
-		fmt.Fprintf(&sb, "%v", v)
+		fmt.Fprintf(sb, "%v", v)
 	}
 	sb.WriteString("\n")
-	return sb.String()
 }
 
+// formatProfile and formatTurns build the memory sections of every chat
+// prompt in a single builder rather than re-copying the text per line.
 func formatProfile(profile map[string]interface{}, pronoun string, factsText string) string {
 	if len(profile) == 0 && factsText == "" {
 		return "（暂无记录）"
 	}
-	parts := ""
+	var sb strings.Builder
 	if name, ok := profile["preferred_name"].(string); ok && name != "" {
-		parts += fmt.Sprintf("- %s喜欢被称为：%s\n", pronoun, name)
+		fmt.Fprintf(&sb, "- %s喜欢被称为：%s\n", pronoun, name)
 	}
 	if hasPets, ok := profile["has_pets"].(bool); ok && hasPets {
 		if details, ok := profile["pet_details"].(string); ok {
-			parts += fmt.Sprintf("- %s有宠物：%s\n", pronoun, details)
+			fmt.Fprintf(&sb, "- %s有宠物：%s\n", pronoun, details)
 		}
 	}
 
 	// Structured facts from DB (Phase 3)
 	if factsText != "" {
-		parts += "- 重要信息：\n" + factsText
+		sb.WriteString("- 重要信息：\n")
+		sb.WriteString(factsText)
 	}
 
-	parts += formatSliceField(profile, "interests", fmt.Sprintf("- %s的兴趣：", pronoun))
-	parts += formatSliceField(profile, "concerns", fmt.Sprintf("- %s曾表达的担忧：", pronoun))
+	writeSliceField(&sb, profile, "interests", "- "+pronoun+"的兴趣：")
+	writeSliceField(&sb, profile, "concerns", "- "+pronoun+"曾表达的担忧：")
 
-	if parts == "" {
+	if sb.Len() == 0 {
 		return "（暂无记录）"
 	}
-	return parts
+	return sb.String()
 }
 
 func formatTurns(turns []map[string]interface{}, summary string, pronoun string) string {
 	if len(turns) == 0 && summary == "" {
 		return "（这是你们的第一次对话）"
 	}
-	var result string
+	var sb strings.Builder
 
 	// Prepend summary of older conversations (Phase 2)
 	if summary != "" {
-		result += "[earlier conversation summary]\n" + summary + "\n\n[recent conversations]\n"
+		sb.WriteString("[earlier conversation summary]\n")
+		sb.WriteString(summary)
+		sb.WriteString("\n\n[recent conversations]\n")
 	}
 
 	start := 0
@@ -1071,15 +1074,43 @@ func formatTurns(turns []map[string]interface{}, summary string, pronoun string)
 		start = len(turns) - promptTurns
 	}
 	for _, t := range turns[start:] {
-		response := fmt.Sprintf("%v", t["assistant_response"])
-		if len([]rune(response)) > 200 {
-			response = string([]rune(response)[:200]) + "..."
+		response := clipRunes(fmt.Sprintf("%v", t["assistant_response"]), 200)
+		fmt.Fprintf(&sb, "%s说：%v\n你回复：%s\n", pronoun, t["user_input"], response)
+	}
+	return sb.String()
+}
+
+// clipRunes cuts s to at most limit runes, appending "..." when it cuts.
+// It walks only as far as the cut instead of decoding the whole string into
+// a []rune, which matters for scraped page markdown.
+func clipRunes(s string, limit int) string {
+	n := 0
+	for i := range s {
+		if n == limit {
+			return s[:i] + "..."
 		}
-		result += fmt.Sprintf("%s说：%v\n你回复：%s\n", pronoun, t["user_input"], response)
+		n++
 	}
-	return result
+	return s
 }
 
+// searchResultSnippet returns the page markdown of a search result, falling
+// back to its description, clipped to limit runes. Chat and the community AI
+// both quote results this way.
+func searchResultSnippet(r firecrawl.SearchResult, limit int) string {
+	content := r.Markdown
+	if content == "" {
+		content = r.Description
+	}
+	return clipRunes(content, limit)
+}
+
+// Compiled once; parseLLMResponse runs on every chat reply.
+var (
+	jsonFencePattern  = regexp.MustCompile("(?s)```json\\s*(.*?)\\s*```")
+	jsonBracesPattern = regexp.MustCompile(`(?s)\{.*\}`)
+)
+
 func parseLLMResponse(content string) map[string]interface{} {
 	var result map[string]interface{}
 
@@ -1089,16 +1120,14 @@ func parseLLMResponse(content string) map[string]interface{} {
 	}
 
 	// Try extract JSON block
-	re := regexp.MustCompile("(?s)```json\\s*(.*?)\\s*```")
-	if matches := re.FindStringSubmatch(content); len(matches) > 1 {
+	if matches := jsonFencePattern.FindStringSubmatch(content); len(matches) > 1 {
 		if err := json.Unmarshal([]byte(matches[1]), &result); err == nil {
 			return result
 		}
 	}
 
 	// Try extract braces
-	re2 := regexp.MustCompile(`(?s)\{.*\}`)
-	if match := re2.FindString(content); match != "" {
+	if match := jsonBracesPattern.FindString(content); match != "" {
 		if err := json.Unmarshal([]byte(match), &result); err == nil {
 			return result
 		}
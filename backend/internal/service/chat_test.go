@@ -0,0 +1,54 @@
+package service
+
+import "testing"
+
+func TestNeedsWebSearch(t *testing.T) {
+	tests := []struct {
+		name    string
+		message string
+		want    bool
+	}{
+		{name: "empty", message: "  ", want: false},
+		{name: "greeting", message: "你好", want: false},
+		{name: "greeting with punctuation", message: "Hello!!", want: false},
+		{name: "tired sigh", message: "我好累~", want: false},
+		{name: "good night", message: "晚安。", want: false},
+		{name: "short chat", message: "今天下雨了", want: true},
+		{name: "short question", message: "宝宝发烧怎么办", want: true},
+		{name: "bare topic", message: "盆底肌修复", want: true},
+		{name: "short bare topic", message: "产后脱发", want: true},
+		{name: "long message", message: "最近晚上总是睡不好，白天也没精神", want: true},
+		{name: "greeting inside longer text", message: "你好，我想问一下产后多久可以运动", want: true},
+	}
+
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			if got := needsWebSearch(tc.message); got != tc.want {
+				t.Errorf("needsWebSearch(%q) = %v, want %v", tc.message, got, tc.want)
+			}
+		})
+	}
+}
+
+func TestClipRunes(t *testing.T) {
+	tests := []struct {
+		name  string
+		s     string
+		limit int
+		want  string
+	}{
+		{name: "shorter", s: "你好", limit: 3, want: "你好"},
+		{name: "exact", s: "你好呀", limit: 3, want: "你好呀"},
+		{name: "cut multibyte", s: "你好呀朋友", limit: 3, want: "你好呀..."},
+		{name: "cut ascii", s: "abcdef", limit: 2, want: "ab..."},
+		{name: "empty", s: "", limit: 2, want: ""},
+	}
+
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			if got := clipRunes(tc.s, tc.limit); got != tc.want {
+				t.Errorf("clipRunes(%q, %d) = %q, want %q", tc.s, tc.limit, got, tc.want)
+			}
+		})
+	}
+}
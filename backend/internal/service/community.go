@@ -317,12 +317,8 @@ func (s *CommunityService) CreateQuestion(req dto.QuestionCreate, author *model.
 	}
 
 	// Associate tags
-	for _, tagID := range req.TagIDs {
-		_ = s.tagRepo.CreateQuestionTag(&model.QuestionTag{
-			QuestionID: q.ID,
-			TagID:      tagID,
-		})
-		_ = s.tagRepo.IncrementQuestionCount(tagID)
+	if linked, err := s.tagRepo.CreateQuestionTags(q.ID, req.TagIDs); err == nil {
+		_ = s.tagRepo.IncrementQuestionCount(linked...)
 	}
 
 	return q, nil
@@ -369,12 +365,7 @@ func (s *CommunityService) UpdateQuestion(questionID string, req dto.QuestionUpd
 
 	if req.TagIDs != nil {
 		_ = s.tagRepo.DeleteQuestionTags(questionID)
-		for _, tagID := range req.TagIDs {
-			_ = s.tagRepo.CreateQuestionTag(&model.QuestionTag{
-				QuestionID: questionID,
-				TagID:      tagID,
-			})
-		}
+		_, _ = s.tagRepo.CreateQuestionTags(questionID, req.TagIDs)
 	}
 
 	q.UpdatedAt = time.Now()
@@ -398,18 +389,12 @@ func (s *CommunityService) DeleteQuestion(questionID string, user *model.User) e
 		return errors.New("无权删除此问题")
 	}
 
-	// Clean up related data
+	// Clean up related data, one statement per table for all answers.
+	// Likes on comments go before the comments themselves.
 	answerIDs, _ := s.answerRepo.FindIDsByQuestionID(questionID)
-	for _, aid := range answerIDs {
-		// Delete likes on comments before deleting the comments themselves
-		if comments, cErr := s.commentRepo.FindByAnswerID(aid); cErr == nil {
-			for _, c := range comments {
-				_ = s.interactionRepo.DeleteLikesByTarget("comment", c.ID)
-			}
-		}
-		_ = s.commentRepo.DeleteByAnswerID(aid)
-		_ = s.interactionRepo.DeleteLikesByTarget("answer", aid)
-	}
+	_ = s.interactionRepo.DeleteCommentLikesByAnswer(answerIDs...)
+	_ = s.commentRepo.DeleteByAnswerID(answerIDs...)
+	_ = s.interactionRepo.DeleteLikesByTarget("answer", answerIDs...)
 	_ = s.answerRepo.DeleteByQuestionID(questionID)
 	_ = s.interactionRepo.DeleteLikesByTarget("question", questionID)
 	_ = s.interactionRepo.DeleteCollectionsByQuestion(questionID)
@@ -642,11 +627,7 @@ func (s *CommunityService) DeleteAnswer(answerID string, user *model.User) error
 	}
 
 	// Delete likes on comments before deleting the comments themselves
-	if comments, cErr := s.commentRepo.FindByAnswerID(answerID); cErr == nil {
-		for _, c := range comments {
-			_ = s.interactionRepo.DeleteLikesByTarget("comment", c.ID)
-		}
-	}
+	_ = s.interactionRepo.DeleteCommentLikesByAnswer(answerID)
 	_ = s.commentRepo.DeleteByAnswerID(answerID)
 	_ = s.interactionRepo.DeleteLikesByTarget("answer", answerID)
 	_ = s.questionRepo.DecrementAnswerCount(a.QuestionID)
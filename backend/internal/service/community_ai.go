@@ -200,14 +200,15 @@ func (s *CommunityAIService) HandleNewComment(answerID, commentID string) {
 		fmt.Fprintf(&sb, "%s：%s\n", role, c.Content)
 	}
 
-	searchCtx, sources := s.searchWeb(ctx, q.Title)
-
 	triggerComment, err := s.commentRepo.FindByID(commentID)
 	if err != nil {
 		log.Printf("[CommunityAI] failed to find trigger comment %s: %v", commentID, err)
 		return
 	}
 
+	// Search only once every lookup has succeeded and the result will be used
+	searchCtx, sources := s.searchWeb(ctx, q.Title)
+
 	authorRole, authorIsAdmin := s.lookupUserRole(triggerComment.AuthorID)
 	reply, err := s.generateReply(ctx, sb.String(), searchCtx, sources, authorRole, authorIsAdmin)
 	if err != nil {
@@ -256,14 +257,7 @@ func (s *CommunityAIService) searchWeb(ctx context.Context, query string) (strin
 	var sources []sourceRef
 	var sb strings.Builder
 	for i, r := range results {
-		content := r.Markdown
-		if content == "" {
-			content = r.Description
-		}
-		if len([]rune(content)) > 500 {
-			content = string([]rune(content)[:500]) + "..."
-		}
-		fmt.Fprintf(&sb, "来源「%s」（%s）：\n%s\n\n", r.Title, r.URL, content)
+		fmt.Fprintf(&sb, "来源「%s」（%s）：\n%s\n\n", r.Title, r.URL, searchResultSnippet(r, 500))
 		sources = append(sources, sourceRef{index: i + 1, title: r.Title, url: r.URL})
 	}
 	return sb.String(), sources
@@ -3,17 +3,20 @@ package service
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"log"
 	"net/url"
 	"regexp"
 	"strings"
 
+	"github.com/jackc/pgx/v5/pgconn"
 	"github.com/momshell/backend/internal/dto"
 	"github.com/momshell/backend/internal/model"
 	"github.com/momshell/backend/internal/repository"
 	"github.com/momshell/backend/pkg/llmvalidate"
 	"github.com/momshell/backend/pkg/openai"
+	"gorm.io/gorm"
 )
 
 const (
@@ -52,17 +55,25 @@ func (s *EchoService) GetIdentityTags(userID string) (*dto.IdentityTagListRespon
 		Memory:     []model.IdentityTag{},
 	}
 
-	for _, tag := range tags {
-		switch tag.TagType {
+	// Rows arrive ordered by tag_type, so each type is a contiguous run that
+	// can be handed out as a sub-slice instead of appended tag by tag.
+	for start := 0; start < len(tags); {
+		end := start + 1
+		for end < len(tags) && tags[end].TagType == tags[start].TagType {
+			end++
+		}
+		group := tags[start:end:end]
+		switch tags[start].TagType {
 		case "music":
-			resp.Music = append(resp.Music, tag)
+			resp.Music = group
 		case "sound":
-			resp.Sound = append(resp.Sound, tag)
+			resp.Sound = group
 		case "literature":
-			resp.Literature = append(resp.Literature, tag)
+			resp.Literature = group
 		case "memory":
-			resp.Memory = append(resp.Memory, tag)
+			resp.Memory = group
 		}
+		start = end
 	}
 
 	return resp, nil
@@ -83,13 +94,27 @@ func (s *EchoService) CreateIdentityTag(userID string, req dto.IdentityTagCreate
 		return nil, fmt.Errorf("content is required")
 	}
 
+	// The unique index does the duplicate check as part of the INSERT
 	if err := s.echoRepo.CreateIdentityTag(tag); err != nil {
+		if isDuplicateKeyError(err) {
+			return nil, fmt.Errorf("tag already exists")
+		}
 		return nil, err
 	}
 
 	return tag, nil
 }
 
+// pgUniqueViolation is the Postgres SQLSTATE for a unique-constraint violation.
+const pgUniqueViolation = "23505"
+
+// isDuplicateKeyError reports whether err is a unique-constraint violation.
+// gorm's TranslateError is not enabled, so the pgx error is inspected directly.
+func isDuplicateKeyError(err error) bool {
+	var pgErr *pgconn.PgError
+	return errors.As(err, &pgErr) && pgErr.Code == pgUniqueViolation
+}
+
 func (s *EchoService) DeleteIdentityTag(userID, tagID string) error {
 	if _, err := s.echoRepo.FindIdentityTagByIDAndUserID(tagID, userID); err != nil {
 		return err
@@ -98,7 +123,14 @@ func (s *EchoService) DeleteIdentityTag(userID, tagID string) error {
 	return s.echoRepo.DeleteIdentityTag(tagID, userID)
 }
 
-func (s *EchoService) GetMemoirs(userID string, limit, offset int) (*dto.MemoirListResponse, error) {
+// ErrInvalidMemoirCursor is returned by GetMemoirs when before does not name
+// one of the family's memoirs.
+var ErrInvalidMemoirCursor = errors.New("invalid before cursor")
+
+// GetMemoirs returns one page of the family's memoirs. A non-empty before
+// (the last memoir ID of the previous page) pages by cursor and offset is
+// ignored; cursor pages carry no total.
+func (s *EchoService) GetMemoirs(userID string, limit, offset int, before string) (*dto.MemoirListResponse, error) {
 	// Collect user IDs: self + partner
 	userIDs := []string{userID}
 	user, err := s.userRepo.FindByID(userID)
@@ -106,22 +138,30 @@ func (s *EchoService) GetMemoirs(userID string, limit, offset int) (*dto.MemoirL
 		userIDs = append(userIDs, *user.PartnerID)
 	}
 
-	memoirs, total, err := s.echoRepo.FindMemoirsByUserIDs(userIDs, limit, offset)
+	resp := &dto.MemoirListResponse{}
+	var memoirs []model.Memoir
+	if before != "" {
+		memoirs, err = s.echoRepo.FindMemoirsByUserIDsBefore(userIDs, before, limit)
+		if errors.Is(err, gorm.ErrRecordNotFound) {
+			return nil, ErrInvalidMemoirCursor
+		}
+	} else {
+		var total int64
+		memoirs, total, err = s.echoRepo.FindMemoirsByUserIDs(userIDs, limit, offset)
+		resp.Total = &total
+	}
 	if err != nil {
 		return nil, err
 	}
 
-	if memoirs == nil {
-		memoirs = []model.Memoir{}
+	resp.Memoirs = toMemoirResponses(memoirs)
+	if len(memoirs) == limit {
+		resp.NextCursor = memoirs[len(memoirs)-1].ID
 	}
-
-	return &dto.MemoirListResponse{
-		Memoirs: memoirs,
-		Total:   total,
-	}, nil
+	return resp, nil
 }
 
-func (s *EchoService) GenerateMemoir(ctx context.Context, userID string, req dto.GenerateMemoirRequest) (*model.Memoir, error) {
+func (s *EchoService) GenerateMemoir(ctx context.Context, userID string, req dto.GenerateMemoirRequest) (*dto.MemoirResponse, error) {
 	tags, err := s.echoRepo.FindIdentityTagsByUserID(userID)
 	if err != nil {
 		return nil, err
@@ -189,25 +229,42 @@ func (s *EchoService) GenerateMemoir(ctx context.Context, userID string, req dto
 		}()
 	}
 
-	return memoir, nil
+	resp := toMemoirResponse(*memoir)
+	return &resp, nil
 }
 
-func (s *EchoService) RateMemoir(userID, memoirID string, rating int) (*model.Memoir, error) {
+func (s *EchoService) RateMemoir(userID, memoirID string, rating int) (*dto.MemoirResponse, error) {
 	if rating < 1 || rating > 5 {
 		return nil, fmt.Errorf("rating must be between 1 and 5")
 	}
 
-	memoir, err := s.echoRepo.FindMemoirByIDAndUserID(memoirID, userID)
+	memoir, err := s.echoRepo.RateMemoir(memoirID, userID, rating)
 	if err != nil {
 		return nil, err
 	}
 
-	memoir.UserRating = &rating
-	if err := s.echoRepo.UpdateMemoir(memoir); err != nil {
-		return nil, err
+	resp := toMemoirResponse(*memoir)
+	return &resp, nil
+}
+
+func toMemoirResponse(m model.Memoir) dto.MemoirResponse {
+	return dto.MemoirResponse{
+		ID:            m.ID,
+		Title:         m.Title,
+		Content:       m.Content,
+		CoverImageURL: m.CoverImageURL,
+		UserRating:    m.UserRating,
+		CreatedAt:     m.CreatedAt,
+		UpdatedAt:     m.UpdatedAt,
 	}
+}
 
-	return memoir, nil
+func toMemoirResponses(memoirs []model.Memoir) []dto.MemoirResponse {
+	items := make([]dto.MemoirResponse, len(memoirs))
+	for i, m := range memoirs {
+		items[i] = toMemoirResponse(m)
+	}
+	return items
 }
 
 func isValidTagType(tagType string) bool {
@@ -219,43 +276,63 @@ func isValidTagType(tagType string) bool {
 	}
 }
 
-func buildMemoirSystemPrompt(tags []model.IdentityTag, theme *string) string {
-	tagLines := "- （暂无身份标签）"
-	if len(tags) > 0 {
-		parts := make([]string, 0, len(tags))
-		for _, tag := range tags {
-			parts = append(parts, fmt.Sprintf("- [%s] %s", tag.TagType, tag.Content))
-		}
-		tagLines = strings.Join(parts, "\n")
-	}
+// Fixed parts of the memoir system prompt; only the tag lines and the theme vary.
+const (
+	memoirPromptHead  = "你是一位温柔的记忆编织者。根据用户的身份标签和主题，创作一段温暖的回忆录。\n\n用户的身份标签：\n"
+	memoirPromptTheme = "\n\n用户给出的主题：\n"
+	memoirPromptTail  = "\n\n请以 JSON 格式回复：\n{\"title\": \"诗意的标题\", \"content\": \"2-4段温暖的回忆文字\"}"
+)
 
+func buildMemoirSystemPrompt(tags []model.IdentityTag, theme *string) string {
 	themeText := "（无特定主题）"
 	if theme != nil && strings.TrimSpace(*theme) != "" {
 		themeText = strings.TrimSpace(*theme)
 	}
 
-	return fmt.Sprintf(`你是一位温柔的记忆编织者。根据用户的身份标签和主题，创作一段温暖的回忆录。
-
-用户的身份标签：
-%s
-
-用户给出的主题：
-%s
-
-请以 JSON 格式回复：
-{"title": "诗意的标题", "content": "2-4段温暖的回忆文字"}`,
-		tagLines,
-		themeText,
-	)
+	// Write everything into one pre-sized builder in a single pass over tags
+	size := len(memoirPromptHead) + len(memoirPromptTheme) + len(themeText) + len(memoirPromptTail)
+	for _, tag := range tags {
+		size += len(tag.TagType) + len(tag.Content) + 6
+	}
+	var sb strings.Builder
+	sb.Grow(size)
+	sb.WriteString(memoirPromptHead)
+	if len(tags) == 0 {
+		sb.WriteString("- （暂无身份标签）")
+	}
+	for i, tag := range tags {
+		if i > 0 {
+			sb.WriteByte('\n')
+		}
+		sb.WriteString("- [")
+		sb.WriteString(tag.TagType)
+		sb.WriteString("] ")
+		sb.WriteString(tag.Content)
+	}
+	sb.WriteString(memoirPromptTheme)
+	sb.WriteString(themeText)
+	sb.WriteString(memoirPromptTail)
+	return sb.String()
 }
 
+// Fallback patterns for memoir replies that are not clean JSON, compiled once
+// rather than on every parse. The fenced and bare object patterns are shared
+// with parseLLMResponse.
+var (
+	memoirTitleFieldPattern   = regexp.MustCompile(`"title"\s*:\s*"((?:[^"\\]|\\.)*)`)
+	memoirContentFieldPattern = regexp.MustCompile(`"content"\s*:\s*"((?:[^"\\]|\\.)*)`)
+	openJSONFencePattern      = regexp.MustCompile("(?s)```json\\s*(.*)")
+
+	// memoirEscapeReplacer undoes the common JSON escapes in one pass, so an
+	// escaped backslash is consumed before it can pair with a following n
+	memoirEscapeReplacer = strings.NewReplacer(`\n`, "\n", `\"`, `"`, `\\`, `\`)
+)
+
 // extractMemoirFieldsByRegex attempts to extract title and content from malformed JSON using regex.
 // Returns nil if no fields could be extracted.
 func extractMemoirFieldsByRegex(content string) map[string]interface{} {
-	titleRe := regexp.MustCompile(`"title"\s*:\s*"((?:[^"\\]|\\.)*)`)
-	contentRe := regexp.MustCompile(`"content"\s*:\s*"((?:[^"\\]|\\.)*)`)
-	titleMatch := titleRe.FindStringSubmatch(content)
-	contentMatch := contentRe.FindStringSubmatch(content)
+	titleMatch := memoirTitleFieldPattern.FindStringSubmatch(content)
+	contentMatch := memoirContentFieldPattern.FindStringSubmatch(content)
 	if titleMatch == nil && contentMatch == nil {
 		return nil
 	}
@@ -267,9 +344,7 @@ func extractMemoirFieldsByRegex(content string) map[string]interface{} {
 	if contentMatch != nil {
 		body = contentMatch[1]
 		// Unescape common JSON escapes
-		body = strings.ReplaceAll(body, `\n`, "\n")
-		body = strings.ReplaceAll(body, `\"`, `"`)
-		body = strings.ReplaceAll(body, `\\`, `\`)
+		body = memoirEscapeReplacer.Replace(body)
 	}
 	return map[string]interface{}{
 		memoirKeyTitle:   cleanMemoirText(title),
@@ -279,8 +354,7 @@ func extractMemoirFieldsByRegex(content string) map[string]interface{} {
 
 // tryParseJSONFromTruncatedBlock handles truncated ```json blocks (no closing ```).
 func tryParseJSONFromTruncatedBlock(content string) map[string]interface{} {
-	re3 := regexp.MustCompile("(?s)```json\\s*(.*)")
-	matches := re3.FindStringSubmatch(content)
+	matches := openJSONFencePattern.FindStringSubmatch(content)
 	if len(matches) <= 1 {
 		return nil
 	}
@@ -291,8 +365,7 @@ func tryParseJSONFromTruncatedBlock(content string) map[string]interface{} {
 		return cleanParsedMemoir(result)
 	}
 	// Try to find JSON object inside
-	re2 := regexp.MustCompile(`(?s)\{.*\}`)
-	if match := re2.FindString(inner); match != "" {
+	if match := jsonBracesPattern.FindString(inner); match != "" {
 		if err := json.Unmarshal([]byte(match), &result); err == nil {
 			return cleanParsedMemoir(result)
 		}
@@ -304,8 +377,7 @@ func parseMemoirLLMResponse(content string) map[string]interface{} {
 	var result map[string]interface{}
 
 	// Strip Qwen3's <think>...</think> blocks
-	thinkRe := regexp.MustCompile(`(?s)<think>.*?</think>`)
-	content = strings.TrimSpace(thinkRe.ReplaceAllString(content, ""))
+	content = llmvalidate.Sanitize(content)
 
 	// Try direct JSON parse
 	if err := json.Unmarshal([]byte(content), &result); err == nil {
@@ -313,16 +385,14 @@ func parseMemoirLLMResponse(content string) map[string]interface{} {
 	}
 
 	// Try extracting from ```json ... ``` code block
-	re := regexp.MustCompile("(?s)```json\\s*(.*?)\\s*```")
-	if matches := re.FindStringSubmatch(content); len(matches) > 1 {
+	if matches := jsonFencePattern.FindStringSubmatch(content); len(matches) > 1 {
 		if err := json.Unmarshal([]byte(matches[1]), &result); err == nil {
 			return cleanParsedMemoir(result)
 		}
 	}
 
 	// Try extracting any JSON object (greedy)
-	re2 := regexp.MustCompile(`(?s)\{.*\}`)
-	if match := re2.FindString(content); match != "" {
+	if match := jsonBracesPattern.FindString(content); match != "" {
 		if err := json.Unmarshal([]byte(match), &result); err == nil {
 			return cleanParsedMemoir(result)
 		}
@@ -386,24 +456,26 @@ func cleanParsedMemoir(m map[string]interface{}) map[string]interface{} {
 	return m
 }
 
-func generateMemoirCoverDataURI(title string, theme *string) string {
-	gradients := [][2]string{
-		{"F6A6B2", "F9D29D"},
-		{"D4A5FF", "F7C3D6"},
-		{"F4B183", "F7E7A9"},
-		{"C5D8A4", "F4C2C2"},
-		{"F8B4C7", "CDB4DB"},
-		{"F7C59F", "F6E7CB"},
-	}
+// memoirCoverGradients is fixed, so it lives at package level rather than
+// being rebuilt for every generated cover.
+var memoirCoverGradients = [...][2]string{
+	{"F6A6B2", "F9D29D"},
+	{"D4A5FF", "F7C3D6"},
+	{"F4B183", "F7E7A9"},
+	{"C5D8A4", "F4C2C2"},
+	{"F8B4C7", "CDB4DB"},
+	{"F7C59F", "F6E7CB"},
+}
 
+func generateMemoirCoverDataURI(title string, theme *string) string {
 	seed := title
 	if theme != nil {
 		seed += *theme
 	}
 
-	index := hashString(seed) % len(gradients)
-	color1 := gradients[index][0]
-	color2 := gradients[index][1]
+	index := hashString(seed) % len(memoirCoverGradients)
+	color1 := memoirCoverGradients[index][0]
+	color2 := memoirCoverGradients[index][1]
 	text := truncateText(title, 24)
 
 	return fmt.Sprintf("data:image/svg+xml,%%3Csvg xmlns='http://www.w3.org/2000/svg' width='400' height='300'%%3E%%3Cdefs%%3E%%3ClinearGradient id='g' x1='0%%25' y1='0%%25' x2='100%%25' y2='100%%25'%%3E%%3Cstop offset='0%%25' style='stop-color:%%23%s'%%2F%%3E%%3Cstop offset='100%%25' style='stop-color:%%23%s'%%2F%%3E%%3C%%2FlinearGradient%%3E%%3C%%2Fdefs%%3E%%3Crect width='400' height='300' fill='url(%%23g)'%%2F%%3E%%3Ctext x='200' y='160' text-anchor='middle' fill='white' font-size='20' font-family='sans-serif'%%3E%s%%3C%%2Ftext%%3E%%3C%%2Fsvg%%3E",
@@ -2,6 +2,7 @@ package service
 
 import (
 	"strings"
+	"unicode/utf8"
 
 	"github.com/momshell/backend/internal/model"
 )
@@ -21,12 +22,14 @@ const (
 	CatHarassment        SensitiveCategory = "harassment"
 )
 
-var autoRejectCategories = map[SensitiveCategory]bool{
-	CatPseudoscience:   true,
-	CatSoftPornography: true,
-	CatViolence:        true,
-	CatSpam:            true,
-	CatHarassment:      true,
+// autoRejectReasons lists the categories that are rejected outright, with
+// the reason shown to the author.
+var autoRejectReasons = map[SensitiveCategory]string{
+	CatPseudoscience:   "内容可能包含未经证实的医疗信息",
+	CatSoftPornography: "内容包含不适当信息",
+	CatViolence:        "内容包含暴力相关信息",
+	CatSpam:            "内容疑似广告或垃圾信息",
+	CatHarassment:      "内容包含不友善言论",
 }
 
 var crisisCategories = map[SensitiveCategory]bool{
@@ -62,6 +65,37 @@ var sensitiveKeywords = map[string]SensitiveCategory{
 	"垃圾人": CatHarassment,
 }
 
+// sensitiveKeywordsByFirstRune indexes sensitiveKeywords by leading rune so
+// scanKeywords can match every keyword in one walk over the content.
+var sensitiveKeywordsByFirstRune = indexKeywordsByFirstRune(sensitiveKeywords)
+
+// sensitiveKeywordsCaseless is true while no keyword contains a cased letter
+// (the list is all CJK today), in which case the content need not be lowered.
+var sensitiveKeywordsCaseless = keywordsCaseless(sensitiveKeywords)
+
+type keywordCategory struct {
+	keyword  string
+	category SensitiveCategory
+}
+
+func indexKeywordsByFirstRune(keywords map[string]SensitiveCategory) map[rune][]keywordCategory {
+	index := make(map[rune][]keywordCategory, len(keywords))
+	for keyword, category := range keywords {
+		first, _ := utf8.DecodeRuneInString(keyword)
+		index[first] = append(index[first], keywordCategory{keyword: keyword, category: category})
+	}
+	return index
+}
+
+func keywordsCaseless(keywords map[string]SensitiveCategory) bool {
+	for keyword := range keywords {
+		if strings.ToLower(keyword) != keyword || strings.ToUpper(keyword) != keyword {
+			return false
+		}
+	}
+	return true
+}
+
 // ModerationDecision holds the result of content moderation
 type ModerationDecision struct {
 	Result     model.ModerationResult
@@ -102,15 +136,7 @@ func (s *ModerationService) ModerateText(content string) ModerationDecision {
 
 	// Check auto-reject
 	for _, cat := range detected {
-		if autoRejectCategories[cat] {
-			reasons := map[SensitiveCategory]string{
-				CatPseudoscience:   "内容可能包含未经证实的医疗信息",
-				CatSoftPornography: "内容包含不适当信息",
-				CatViolence:        "内容包含暴力相关信息",
-				CatSpam:            "内容疑似广告或垃圾信息",
-				CatHarassment:      "内容包含不友善言论",
-			}
-			reason := reasons[cat]
+		if reason, ok := autoRejectReasons[cat]; ok {
 			return ModerationDecision{
 				Result:     model.ModerationRejected,
 				Categories: detected,
@@ -141,16 +167,25 @@ func (s *ModerationService) ModerateText(content string) ModerationDecision {
 }
 
 func (s *ModerationService) scanKeywords(content string) []SensitiveCategory {
-	lower := strings.ToLower(content)
-	seen := make(map[SensitiveCategory]bool)
+	lower := content
+	if !sensitiveKeywordsCaseless {
+		lower = strings.ToLower(content)
+	}
+	var seen map[SensitiveCategory]bool
 	var result []SensitiveCategory
 
-	for keyword, category := range sensitiveKeywords {
-		if strings.Contains(lower, keyword) {
-			if !seen[category] {
-				seen[category] = true
-				result = append(result, category)
+	// Categories are reported in the order their first keyword appears.
+	for i, r := range lower {
+		candidates := sensitiveKeywordsByFirstRune[r]
+		for _, kc := range candidates {
+			if seen[kc.category] || !strings.HasPrefix(lower[i:], kc.keyword) {
+				continue
+			}
+			if seen == nil {
+				seen = make(map[SensitiveCategory]bool)
 			}
+			seen[kc.category] = true
+			result = append(result, kc.category)
 		}
 	}
 
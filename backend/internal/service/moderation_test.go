@@ -0,0 +1,30 @@
+package service
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestScanKeywords(t *testing.T) {
+	svc := NewModerationService()
+	tests := []struct {
+		name    string
+		content string
+		want    []SensitiveCategory
+	}{
+		{name: "clean", content: "今天宝宝睡得很好", want: nil},
+		{name: "single", content: "加微信了解详情", want: []SensitiveCategory{CatSpam}},
+		{name: "overlapping keywords", content: "我想自杀了", want: []SensitiveCategory{CatSelfHarm, CatViolence}},
+		{name: "order of appearance", content: "废物，不想活了", want: []SensitiveCategory{CatHarassment, CatSelfHarm}},
+		{name: "mixed case latin text", content: "ADD ME 加微信 OK", want: []SensitiveCategory{CatSpam}},
+		{name: "category reported once", content: "自残，自杀", want: []SensitiveCategory{CatSelfHarm}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := svc.scanKeywords(tt.content); !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("scanKeywords(%q) = %v, want %v", tt.content, got, tt.want)
+			}
+		})
+	}
+}
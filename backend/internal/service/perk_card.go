@@ -27,7 +27,7 @@ func NewPerkCardService(perkRepo *repository.PerkCardRepo, userRepo *repository.
 }
 
 func (s *PerkCardService) CreatePerkCard(callerID string, req dto.CreatePerkCardRequest) (*dto.PerkCardItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -59,7 +59,7 @@ func (s *PerkCardService) CreatePerkCard(callerID string, req dto.CreatePerkCard
 }
 
 func (s *PerkCardService) GetPerkCards(callerID string) ([]dto.PerkCardItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -82,22 +82,24 @@ func (s *PerkCardService) GetPerkCards(callerID string) ([]dto.PerkCardItem, err
 
 	now := time.Now()
 	items := make([]dto.PerkCardItem, 0, len(cards))
+	var expired []string
 	for i := range cards {
 		// Auto-expire active cards when reading
 		if cards[i].Status == model.PerkActive && cards[i].ExpiresAt != nil && cards[i].ExpiresAt.Before(now) {
 			cards[i].Status = model.PerkExpired
-			if err := s.perkRepo.MarkExpired(cards[i].ID); err != nil {
-				log.Printf("[PerkCard] mark expired failed: %v", err)
-			}
+			expired = append(expired, cards[i].ID)
 		}
 		items = append(items, toPerkCardItem(cards[i]))
 	}
+	if err := s.perkRepo.MarkExpired(expired...); err != nil {
+		log.Printf("[PerkCard] mark expired failed: %v", err)
+	}
 
 	return items, nil
 }
 
 func (s *PerkCardService) UsePerkCard(callerID, cardID string) (*dto.PerkCardItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
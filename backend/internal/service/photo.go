@@ -28,6 +28,8 @@ const (
 	maxPhotosPerFamily = 50
 	maxWallPhotos      = 10
 	errPhotoNotFound   = "photo not found"
+	// emptyTagsJSON is stored for cleared tags so neither side runs the JSON codec
+	emptyTagsJSON = "[]"
 )
 
 type PhotoService struct {
@@ -46,23 +48,38 @@ func NewPhotoService(photoRepo *repository.PhotoRepo, userRepo *repository.UserR
 	}
 }
 
-func (s *PhotoService) getFamilyIDs(userID string) []string {
+// photoFamily is the caller plus partner, resolved once per request so that
+// nickname and role lookups reuse the rows already loaded for the family IDs.
+type photoFamily struct {
+	ids   []string
+	users map[string]*model.User
+}
+
+func (s *PhotoService) loadFamily(userID string) *photoFamily {
+	f := &photoFamily{ids: []string{userID}, users: make(map[string]*model.User, 2)}
 	user, err := s.userRepo.FindByID(userID)
 	if err != nil {
-		return []string{userID}
+		return f
 	}
+	f.users[userID] = user
 	if user.PartnerID != nil && *user.PartnerID != "" {
-		return []string{userID, *user.PartnerID}
+		f.ids = append(f.ids, *user.PartnerID)
 	}
-	return []string{userID}
+	return f
 }
 
-func (s *PhotoService) buildNicknameMap(familyIDs []string) map[string]string {
-	m := make(map[string]string, len(familyIDs))
-	for _, id := range familyIDs {
-		if u, err := s.userRepo.FindByID(id); err == nil {
-			m[id] = u.Nickname
+func (s *PhotoService) buildNicknameMap(f *photoFamily) map[string]string {
+	m := make(map[string]string, len(f.ids))
+	for _, id := range f.ids {
+		u, ok := f.users[id]
+		if !ok {
+			var err error
+			if u, err = s.userRepo.FindByID(id); err != nil {
+				continue
+			}
+			f.users[id] = u
 		}
+		m[id] = u.Nickname
 	}
 	return m
 }
@@ -76,14 +93,15 @@ func (s *PhotoService) ListPhotos(userID string, page, pageSize int) (*dto.Photo
 	}
 	offset := (page - 1) * pageSize
 
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	photos, total, err := s.photoRepo.FindByFamilyIDs(familyIDs, pageSize, offset)
 	if err != nil {
 		return nil, fmt.Errorf("failed to list photos: %w", err)
 	}
 
 	totalPages := int(math.Ceil(float64(total) / float64(pageSize)))
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 
 	items := make([]dto.PhotoResponse, 0, len(photos))
 	for _, p := range photos {
@@ -100,18 +118,20 @@ func (s *PhotoService) ListPhotos(userID string, page, pageSize int) (*dto.Photo
 }
 
 func (s *PhotoService) GetPhoto(id, userID string) (*dto.PhotoResponse, error) {
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	photo, err := s.photoRepo.FindByIDAndFamilyIDs(id, familyIDs)
 	if err != nil {
 		return nil, errors.New(errPhotoNotFound)
 	}
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	resp := toPhotoResponse(*photo, nicknameMap[photo.UserID])
 	return &resp, nil
 }
 
 func (s *PhotoService) CreateFromUpload(userID, title, imageURL string) (*dto.PhotoResponse, error) {
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	count, err := s.photoRepo.CountByFamilyIDs(familyIDs)
 	if err != nil {
 		return nil, fmt.Errorf("failed to check photo count: %w", err)
@@ -131,7 +151,7 @@ func (s *PhotoService) CreateFromUpload(userID, title, imageURL string) (*dto.Ph
 		return nil, fmt.Errorf("failed to create photo: %w", err)
 	}
 
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	resp := toPhotoResponse(*photo, nicknameMap[userID])
 	return &resp, nil
 }
@@ -141,7 +161,8 @@ func (s *PhotoService) GeneratePhoto(ctx context.Context, userID string, req dto
 		return nil, fmt.Errorf("image generation is not configured")
 	}
 
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	count, err := s.photoRepo.CountByFamilyIDs(familyIDs)
 	if err != nil {
 		return nil, fmt.Errorf("failed to check photo count: %w", err)
@@ -151,7 +172,7 @@ func (s *PhotoService) GeneratePhoto(ctx context.Context, userID string, req dto
 	}
 
 	var userRole string
-	if user, err := s.userRepo.FindByID(userID); err == nil {
+	if user, ok := family.users[userID]; ok {
 		userRole = string(user.Role)
 	}
 
@@ -178,13 +199,14 @@ func (s *PhotoService) GeneratePhoto(ctx context.Context, userID string, req dto
 		return nil, fmt.Errorf("failed to create photo: %w", err)
 	}
 
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	resp := toPhotoResponse(*photo, nicknameMap[userID])
 	return &resp, nil
 }
 
 func (s *PhotoService) UpdatePhoto(id, userID string, req dto.UpdatePhotoRequest) (*dto.PhotoResponse, error) {
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	photo, err := s.photoRepo.FindByIDAndFamilyIDs(id, familyIDs)
 	if err != nil {
 		return nil, errors.New(errPhotoNotFound)
@@ -196,7 +218,11 @@ func (s *PhotoService) UpdatePhoto(id, userID string, req dto.UpdatePhotoRequest
 	if req.Description != nil {
 		photo.Description = *req.Description
 	}
-	if req.Tags != nil {
+	switch {
+	case req.Tags == nil:
+	case len(req.Tags) == 0:
+		photo.Tags = emptyTagsJSON
+	default:
 		tagsJSON, jsonErr := json.Marshal(req.Tags)
 		if jsonErr != nil {
 			return nil, fmt.Errorf("failed to encode tags: %w", jsonErr)
@@ -208,13 +234,14 @@ func (s *PhotoService) UpdatePhoto(id, userID string, req dto.UpdatePhotoRequest
 		return nil, fmt.Errorf("failed to update photo: %w", err)
 	}
 
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	resp := toPhotoResponse(*photo, nicknameMap[photo.UserID])
 	return &resp, nil
 }
 
 func (s *PhotoService) DeletePhoto(id, userID string) error {
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	photo, err := s.photoRepo.FindByIDAndFamilyIDs(id, familyIDs)
 	if err != nil {
 		return errors.New(errPhotoNotFound)
@@ -227,7 +254,8 @@ func (s *PhotoService) DeletePhoto(id, userID string) error {
 }
 
 func (s *PhotoService) ToggleWall(id, userID string, req dto.ToggleWallRequest) (*dto.PhotoResponse, error) {
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 	photo, err := s.photoRepo.FindByIDAndFamilyIDs(id, familyIDs)
 	if err != nil {
 		return nil, errors.New(errPhotoNotFound)
@@ -253,7 +281,7 @@ func (s *PhotoService) ToggleWall(id, userID string, req dto.ToggleWallRequest)
 		return nil, fmt.Errorf("failed to update photo: %w", err)
 	}
 
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	resp := toPhotoResponse(*photo, nicknameMap[photo.UserID])
 	return &resp, nil
 }
@@ -263,7 +291,8 @@ func (s *PhotoService) BatchUpdateWall(userID string, req dto.BatchWallUpdateReq
 		return nil, fmt.Errorf("too many wall photos (max %d)", maxWallPhotos)
 	}
 
-	familyIDs := s.getFamilyIDs(userID)
+	family := s.loadFamily(userID)
+	familyIDs := family.ids
 
 	updates := make([]repository.WallUpdate, 0, len(req.Photos))
 	for _, item := range req.Photos {
@@ -282,7 +311,7 @@ func (s *PhotoService) BatchUpdateWall(userID string, req dto.BatchWallUpdateReq
 		return nil, fmt.Errorf("failed to fetch wall photos: %w", err)
 	}
 
-	nicknameMap := s.buildNicknameMap(familyIDs)
+	nicknameMap := s.buildNicknameMap(family)
 	results := make([]dto.PhotoResponse, 0, len(wallPhotos))
 	for _, p := range wallPhotos {
 		results = append(results, toPhotoResponse(p, nicknameMap[p.UserID]))
@@ -364,12 +393,11 @@ func downloadFromURL(imageURL, savePath string) (string, error) {
 }
 
 func toPhotoResponse(p model.Photo, ownerNickname string) dto.PhotoResponse {
-	var tags []string
+	// jsonb only ever holds valid JSON, so the stored array is passed
+	// through without decoding and re-encoding it
+	tags := json.RawMessage(emptyTagsJSON)
 	if p.Tags != "" {
-		_ = json.Unmarshal([]byte(p.Tags), &tags)
-	}
-	if tags == nil {
-		tags = []string{}
+		tags = json.RawMessage(p.Tags)
 	}
 
 	return dto.PhotoResponse{
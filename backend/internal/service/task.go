@@ -11,6 +11,7 @@ import (
 	"github.com/momshell/backend/internal/model"
 	"github.com/momshell/backend/internal/repository"
 	"github.com/momshell/backend/pkg/openai"
+	"gorm.io/gorm"
 )
 
 const (
@@ -59,7 +60,7 @@ func today() time.Time {
 
 // GetDailyTasks returns today's whisper-intel tasks for a Dad user.
 func (s *TaskService) GetDailyTasks(userID string) ([]dto.UserTaskItem, error) {
-	user, err := s.userRepo.FindByID(userID)
+	user, err := s.userRepo.FindBinding(userID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -71,37 +72,39 @@ func (s *TaskService) GetDailyTasks(userID string) ([]dto.UserTaskItem, error) {
 	}
 
 	date := today()
-	tasks, err := s.taskRepo.FindUserTasksByDate(userID, date)
+	tasks, err := s.taskRepo.FindWhisperTasksByDate(userID, date)
 	if err != nil {
 		return nil, err
 	}
 
-	return toTaskItems(filterWhisperDrivenTasks(tasks)), nil
+	return toTaskItems(tasks), nil
 }
 
 // CompleteTask marks a task as completed by the Dad user.
 // proofPhotoURL is optional.
 func (s *TaskService) CompleteTask(userID, taskID string, proofPhotoURL *string) (*dto.UserTaskItem, error) {
-	ut, err := s.taskRepo.FindUserTaskByID(taskID)
-	if err != nil {
-		return nil, errors.New(errTaskNotFound)
-	}
-	if ut.UserID != userID {
-		return nil, fmt.Errorf("无权操作此任务")
-	}
-	if ut.Status != model.TaskPending {
-		return nil, fmt.Errorf("任务已完成或已验收")
+	updates := map[string]any{
+		"status":       model.TaskCompleted,
+		"completed_at": time.Now(),
 	}
-
-	now := time.Now()
-	ut.Status = model.TaskCompleted
-	ut.CompletedAt = &now
 	if proofPhotoURL != nil && *proofPhotoURL != "" {
-		ut.ProofPhotoURL = proofPhotoURL
+		updates["proof_photo_url"] = *proofPhotoURL
 	}
 
-	if err := s.taskRepo.UpdateUserTask(ut); err != nil {
-		return nil, err
+	ut, err := s.taskRepo.TransitionUserTask(taskID, userID, model.TaskPending, updates)
+	if err != nil {
+		if !errors.Is(err, gorm.ErrRecordNotFound) {
+			return nil, err
+		}
+		// Nothing matched: look the task up only to explain why
+		current, findErr := s.taskRepo.FindUserTaskByID(taskID)
+		if findErr != nil {
+			return nil, errors.New(errTaskNotFound)
+		}
+		if current.UserID != userID {
+			return nil, fmt.Errorf("无权操作此任务")
+		}
+		return nil, fmt.Errorf("任务已完成或已验收")
 	}
 
 	item := toTaskItem(*ut)
@@ -110,7 +113,7 @@ func (s *TaskService) CompleteTask(userID, taskID string, proofPhotoURL *string)
 
 // GetPartnerTasks returns the partner (Dad)'s tasks for Mom to review.
 func (s *TaskService) GetPartnerTasks(callerID string) ([]dto.UserTaskItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -122,25 +125,25 @@ func (s *TaskService) GetPartnerTasks(callerID string) ([]dto.UserTaskItem, erro
 	}
 
 	date := today()
-	tasks, err := s.taskRepo.FindUserTasksByDate(*user.PartnerID, date)
+	tasks, err := s.taskRepo.FindWhisperTasksByDate(*user.PartnerID, date)
 	if err != nil {
 		return nil, err
 	}
 
-	// Filter out pending tasks — mom only sees completed/verified
-	var visible []model.UserTask
-	for _, t := range filterWhisperDrivenTasks(tasks) {
+	// Mom only reviews tasks that are completed or verified
+	items := make([]dto.UserTaskItem, 0, len(tasks))
+	for _, t := range tasks {
 		if t.Status != model.TaskPending {
-			visible = append(visible, t)
+			items = append(items, toTaskItem(t))
 		}
 	}
 
-	return toTaskItems(visible), nil
+	return items, nil
 }
 
 // requireMomWithPartner validates that the caller is a Mom with a linked partner.
 func (s *TaskService) requireMomWithPartner(callerID string) (*model.User, error) {
-	caller, err := s.userRepo.FindByID(callerID)
+	caller, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -153,6 +156,28 @@ func (s *TaskService) requireMomWithPartner(callerID string) (*model.User, error
 	return caller, nil
 }
 
+// transitionPartnerTask applies updates to a task of the caller's partner in
+// the expected status. The caller's role and binding are checked by the
+// UPDATE itself; only when nothing matches are the caller and task looked
+// up to explain why.
+func (s *TaskService) transitionPartnerTask(callerID, taskID string, expectedStatus model.TaskStatus, updates map[string]any) (*model.UserTask, error) {
+	ut, err := s.taskRepo.TransitionPartnerTask(taskID, callerID, expectedStatus, updates)
+	if err == nil {
+		return ut, nil
+	}
+	if !errors.Is(err, gorm.ErrRecordNotFound) {
+		return nil, err
+	}
+	caller, err := s.requireMomWithPartner(callerID)
+	if err != nil {
+		return nil, err
+	}
+	if _, findErr := s.findPartnerTask(*caller.PartnerID, taskID, expectedStatus); findErr != nil {
+		return nil, findErr
+	}
+	return nil, fmt.Errorf("任务状态不符合要求")
+}
+
 // findPartnerTask finds a task and validates it belongs to the caller's partner with the expected status.
 func (s *TaskService) findPartnerTask(partnerID, taskID string, expectedStatus model.TaskStatus) (*model.UserTask, error) {
 	ut, err := s.taskRepo.FindUserTaskByID(taskID)
@@ -173,33 +198,30 @@ func (s *TaskService) findPartnerTask(partnerID, taskID string, expectedStatus m
 
 // ScoreTask allows Mom to verify and score a completed task.
 func (s *TaskService) ScoreTask(callerID, taskID string, req dto.TaskScore) (*dto.UserTaskItem, error) {
-	caller, err := s.requireMomWithPartner(callerID)
-	if err != nil {
-		return nil, err
+	updates := map[string]any{
+		"status":       model.TaskVerified,
+		"score":        req.Score,
+		"scored_by_id": callerID,
+		"scored_at":    time.Now(),
 	}
-
-	ut, err := s.findPartnerTask(*caller.PartnerID, taskID, model.TaskCompleted)
-	if err != nil {
-		return nil, err
-	}
-
-	now := time.Now()
-	ut.Status = model.TaskVerified
-	ut.Score = &req.Score
 	if req.Comment != "" {
-		ut.Comment = &req.Comment
+		updates["comment"] = req.Comment
 	}
-	ut.ScoredByID = &callerID
-	ut.ScoredAt = &now
 
-	if err := s.taskRepo.UpdateUserTask(ut); err != nil {
+	ut, err := s.transitionPartnerTask(callerID, taskID, model.TaskCompleted, updates)
+	if err != nil {
 		return nil, err
 	}
 
+	// Achievement evaluation aggregates the dad's whole history; run it off
+	// the request so Mom gets the scored task back after a single UPDATE
 	if s.achievementService != nil {
-		if err := s.achievementService.CheckAndUnlock(ut.UserID); err != nil {
-			log.Printf("[TaskService] achievement check failed: %v", err)
-		}
+		dadID := ut.UserID
+		go func() {
+			if err := s.achievementService.CheckAndUnlock(dadID); err != nil {
+				log.Printf("[TaskService] achievement check failed: %v", err)
+			}
+		}()
 	}
 
 	if s.openaiClient != nil && s.photoRepo != nil && s.imageModel != "" {
@@ -243,24 +265,17 @@ func (s *TaskService) RegenerateTaskCard(callerID, taskID string) error {
 
 // RejectTask allows Mom to reject a completed task back to pending.
 func (s *TaskService) RejectTask(callerID, taskID string, comment string) (*dto.UserTaskItem, error) {
-	caller, err := s.requireMomWithPartner(callerID)
-	if err != nil {
-		return nil, err
+	updates := map[string]any{
+		"status":          model.TaskPending,
+		"completed_at":    nil,
+		"proof_photo_url": nil,
 	}
-
-	ut, err := s.findPartnerTask(*caller.PartnerID, taskID, model.TaskCompleted)
-	if err != nil {
-		return nil, err
-	}
-
-	ut.Status = model.TaskPending
-	ut.CompletedAt = nil
-	ut.ProofPhotoURL = nil
 	if comment != "" {
-		ut.Comment = &comment
+		updates["comment"] = comment
 	}
 
-	if err := s.taskRepo.ResetUserTaskToPending(ut); err != nil {
+	ut, err := s.transitionPartnerTask(callerID, taskID, model.TaskCompleted, updates)
+	if err != nil {
 		return nil, err
 	}
 
@@ -270,7 +285,7 @@ func (s *TaskService) RejectTask(callerID, taskID string, comment string) (*dto.
 
 // GetTaskStats returns XP and level for a user (Dad).
 func (s *TaskService) GetTaskStats(userID string) (*dto.TaskStats, error) {
-	user, err := s.userRepo.FindByID(userID)
+	user, err := s.userRepo.FindBinding(userID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -345,16 +360,6 @@ func toTaskItems(tasks []model.UserTask) []dto.UserTaskItem {
 	return items
 }
 
-func filterWhisperDrivenTasks(tasks []model.UserTask) []model.UserTask {
-	filtered := make([]model.UserTask, 0, len(tasks))
-	for _, task := range tasks {
-		if task.Source == model.TaskSourceWhisper {
-			filtered = append(filtered, task)
-		}
-	}
-	return filtered
-}
-
 func resolveTaskContent(ut model.UserTask) (title string, description string, category string, difficulty int) {
 	if ut.Source != model.TaskSourceTemplate {
 		return ut.AITitle, ut.AIDescription, ut.AICategory, ut.AIDifficulty
@@ -396,7 +401,7 @@ func (s *TaskService) GetBabyAge(userID string) (*dto.BabyAgeResponse, error) {
 
 // RegenerateTasks returns the current whisper-driven tasks.
 func (s *TaskService) RegenerateTasks(userID string) ([]dto.UserTaskItem, error) {
-	user, err := s.userRepo.FindByID(userID)
+	user, err := s.userRepo.FindBinding(userID)
 	if err != nil {
 		return nil, errors.New(errUserNotFound)
 	}
@@ -408,9 +413,9 @@ func (s *TaskService) RegenerateTasks(userID string) ([]dto.UserTaskItem, error)
 	}
 
 	date := today()
-	tasks, err := s.taskRepo.FindUserTasksByDate(userID, date)
+	tasks, err := s.taskRepo.FindWhisperTasksByDate(userID, date)
 	if err != nil {
 		return nil, err
 	}
-	return toTaskItems(filterWhisperDrivenTasks(tasks)), nil
+	return toTaskItems(tasks), nil
 }
@@ -123,19 +123,19 @@ func inferAgeStageFromMemory(content string) string {
 	return ""
 }
 
-func normalizeAITasks(tasks []AITaskData) []AITaskData {
-	// Validate categories
-	validCategories := map[string]bool{
-		"housework": true, "parenting": true,
-		"health": true, "emotional": true,
-	}
-	validPriorities := map[string]bool{
-		"T0": true, "T1": true, "T2": true,
-	}
+var validAITaskCategories = map[string]bool{
+	"housework": true, "parenting": true,
+	"health": true, "emotional": true,
+}
 
+var validAITaskPriorities = map[string]bool{
+	"T0": true, "T1": true, "T2": true,
+}
+
+func normalizeAITasks(tasks []AITaskData) []AITaskData {
 	for i := range tasks {
 		tasks[i].Category = strings.ToLower(strings.TrimSpace(tasks[i].Category))
-		if !validCategories[tasks[i].Category] {
+		if !validAITaskCategories[tasks[i].Category] {
 			tasks[i].Category = "parenting"
 		}
 		if tasks[i].Difficulty < 1 {
@@ -146,7 +146,7 @@ func normalizeAITasks(tasks []AITaskData) []AITaskData {
 		}
 
 		tasks[i].Priority = strings.ToUpper(strings.TrimSpace(tasks[i].Priority))
-		if !validPriorities[tasks[i].Priority] {
+		if !validAITaskPriorities[tasks[i].Priority] {
 			tasks[i].Priority = "T2"
 		}
 	}
@@ -128,29 +128,6 @@ func TestToTaskItems_Empty(t *testing.T) {
 	}
 }
 
-func TestFilterWhisperDrivenTasks(t *testing.T) {
-	tasks := []model.UserTask{
-		{ID: "1", Source: model.TaskSourceWhisper},
-		{ID: "2", Source: model.TaskSourceTemplate},
-		{ID: "3", Source: model.TaskSourceAI},
-		{ID: "4", Source: model.TaskSourceWhisper},
-	}
-	result := filterWhisperDrivenTasks(tasks)
-	if len(result) != 2 {
-		t.Fatalf("len = %d, want 2", len(result))
-	}
-	if result[0].ID != "1" || result[1].ID != "4" {
-		t.Errorf("IDs = %q, %q", result[0].ID, result[1].ID)
-	}
-}
-
-func TestFilterWhisperDrivenTasks_Empty(t *testing.T) {
-	result := filterWhisperDrivenTasks(nil)
-	if len(result) != 0 {
-		t.Errorf("expected empty, got %d", len(result))
-	}
-}
-
 func TestResolveTaskContent_AI(t *testing.T) {
 	ut := model.UserTask{
 		Source:        model.TaskSourceAI,
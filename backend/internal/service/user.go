@@ -4,6 +4,7 @@ import (
 	"crypto/rand"
 	"errors"
 	"math/big"
+	"strings"
 
 	"github.com/momshell/backend/internal/dto"
 	"github.com/momshell/backend/internal/model"
@@ -44,7 +45,7 @@ func NewUserService(
 }
 
 func (s *UserService) GetProfile(userID string) (*dto.UserProfile, error) {
-	user, err := s.userRepo.FindByID(userID)
+	user, partner, err := s.userRepo.FindWithPartner(userID)
 	if err != nil {
 		if errors.Is(err, gorm.ErrRecordNotFound) {
 			return nil, errors.New(errUserServiceUserNotFound)
@@ -75,15 +76,12 @@ func (s *UserService) GetProfile(userID string) (*dto.UserProfile, error) {
 		CreatedAt:          user.CreatedAt,
 	}
 
-	if user.PartnerID != nil {
-		partner, err := s.userRepo.FindByID(*user.PartnerID)
-		if err == nil {
-			profile.Partner = &dto.PartnerInfo{
-				ID:        partner.ID,
-				Nickname:  partner.Nickname,
-				AvatarURL: partner.AvatarURL,
-				Role:      string(partner.Role),
-			}
+	if partner != nil {
+		profile.Partner = &dto.PartnerInfo{
+			ID:        partner.ID,
+			Nickname:  partner.Nickname,
+			AvatarURL: partner.AvatarURL,
+			Role:      string(partner.Role),
 		}
 	}
 
@@ -168,7 +166,7 @@ func (s *UserService) UpdateProfile(userID string, req dto.UserProfileUpdate) (*
 
 // GenerateShellCode generates a shell code for 溯源者 (mom) to share with their partner.
 func (s *UserService) GenerateShellCode(userID string) (*dto.UserProfile, error) {
-	user, err := s.userRepo.FindByID(userID)
+	user, err := s.userRepo.FindBinding(userID)
 	if err != nil {
 		return nil, errors.New(errUserServiceUserNotFound)
 	}
@@ -181,16 +179,14 @@ func (s *UserService) GenerateShellCode(userID string) (*dto.UserProfile, error)
 		return nil, errors.New("已绑定伴侣，无法重新生成贝壳码")
 	}
 
-	// Generate if not already present
-	if user.ShellCode == nil {
-		code, err := generateRandomCode(8)
-		if err != nil {
-			return nil, errors.New("生成贝壳码失败")
-		}
-		user.ShellCode = &code
-		if err := s.userRepo.Update(user); err != nil {
-			return nil, err
-		}
+	// An existing code is kept: the UPDATE only fills an empty shell_code,
+	// so there is no need to read it first
+	code, err := generateRandomCode(shellCodeLength)
+	if err != nil {
+		return nil, errors.New("生成贝壳码失败")
+	}
+	if err := s.userRepo.SetShellCodeIfAbsent(userID, code); err != nil {
+		return nil, err
 	}
 
 	return s.GetProfile(userID)
@@ -198,8 +194,14 @@ func (s *UserService) GenerateShellCode(userID string) (*dto.UserProfile, error)
 
 // BindPartner binds a 守护者 (dad) to a 溯源者 (mom) via shell code.
 func (s *UserService) BindPartner(userID, shellCode string) (*dto.UserProfile, error) {
-	user, err := s.userRepo.FindByID(userID)
-	if err != nil {
+	shellCode, ok := normalizeShellCode(shellCode)
+	if !ok {
+		return nil, errors.New("贝壳码无效")
+	}
+
+	// Caller and shell-code owner come back from one round-trip
+	user, partner, err := s.userRepo.FindByIDOrShellCode(userID, shellCode)
+	if err != nil || user == nil {
 		return nil, errors.New(errUserServiceUserNotFound)
 	}
 
@@ -211,8 +213,7 @@ func (s *UserService) BindPartner(userID, shellCode string) (*dto.UserProfile, e
 		return nil, errors.New("您已绑定伴侣")
 	}
 
-	partner, err := s.userRepo.FindByShellCode(shellCode)
-	if err != nil {
+	if partner == nil {
 		return nil, errors.New("贝壳码无效")
 	}
 
@@ -247,53 +248,51 @@ func (s *UserService) BindPartner(userID, shellCode string) (*dto.UserProfile, e
 
 // UnbindPartner removes the partner relationship for the current user.
 func (s *UserService) UnbindPartner(userID string) (*dto.UserProfile, error) {
-	user, err := s.userRepo.FindByID(userID)
+	// Unbind both sides and clear shell codes in a single statement
+	unbound, err := s.userRepo.UnbindPartner(userID)
 	if err != nil {
-		return nil, errors.New(errUserServiceUserNotFound)
+		return nil, errors.New("解绑失败")
 	}
-
-	if user.PartnerID == nil {
+	if unbound == 0 {
 		return nil, errors.New("您尚未绑定伴侣")
 	}
 
-	partnerID := *user.PartnerID
-
-	// Unbind both sides, clear shell code
-	err = s.db.Transaction(func(tx *gorm.DB) error {
-		if err := tx.Model(&model.User{}).Where(whereIDEquals, userID).Updates(map[string]interface{}{
-			"partner_id": nil,
-			"shell_code": nil,
-		}).Error; err != nil {
-			return err
-		}
-		if err := tx.Model(&model.User{}).Where(whereIDEquals, partnerID).Updates(map[string]interface{}{
-			"partner_id": nil,
-			"shell_code": nil,
-		}).Error; err != nil {
-			return err
-		}
-		return nil
-	})
-	if err != nil {
-		return nil, errors.New("解绑失败")
-	}
-
 	return s.GetProfile(userID)
 }
 
+const (
+	shellCodeLength  = 8
+	shellCodeCharset = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+)
+
 func generateRandomCode(length int) (string, error) {
-	const charset = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
 	code := make([]byte, length)
 	for i := range code {
-		n, err := rand.Int(rand.Reader, big.NewInt(int64(len(charset))))
+		n, err := rand.Int(rand.Reader, big.NewInt(int64(len(shellCodeCharset))))
 		if err != nil {
 			return "", err
 		}
-		code[i] = charset[n.Int64()]
+		code[i] = shellCodeCharset[n.Int64()]
 	}
 	return string(code), nil
 }
 
+// normalizeShellCode upper-cases a user-typed shell code and reports whether
+// it can match a generated one at all, so malformed input never reaches the
+// database.
+func normalizeShellCode(code string) (string, bool) {
+	code = strings.ToUpper(strings.TrimSpace(code))
+	if len(code) != shellCodeLength {
+		return code, false
+	}
+	for i := 0; i < len(code); i++ {
+		if strings.IndexByte(shellCodeCharset, code[i]) < 0 {
+			return code, false
+		}
+	}
+	return code, true
+}
+
 func (s *UserService) GetUserQuestions(userID string, page, pageSize int) (*dto.PaginatedResponse, error) {
 	offset := (page - 1) * pageSize
 	questions, total, err := s.questionRepo.FindByAuthorID(userID, offset, pageSize)
@@ -378,29 +377,28 @@ func (s *UserService) GetUserAnswers(userID string, page, pageSize int) (*dto.Pa
 }
 
 func (s *UserService) getUserStats(userID string) (*dto.UserStats, error) {
-	_, questionTotal, _ := s.questionRepo.FindByAuthorID(userID, 0, 1)
-	_, answerTotal, _ := s.answerRepo.FindByAuthorID(userID, 0, 1)
-
-	// Sum likes received
-	var questionLikes, answerLikes int64
-	_ = s.db.Model(&model.Question{}).
-		Where("author_id = ?", userID).
-		Select("COALESCE(SUM(like_count), 0)").
-		Row().Scan(&questionLikes)
-	_ = s.db.Model(&model.Answer{}).
-		Where("author_id = ?", userID).
-		Select("COALESCE(SUM(like_count), 0)").
-		Row().Scan(&answerLikes)
-
-	var collectionCount int64
-	s.db.Model(&model.Collection{}).
-		Where("user_id = ?", userID).
-		Count(&collectionCount)
+	// All counters in one round-trip instead of a query (plus preloads) each
+	var row struct {
+		QuestionCount   int64
+		AnswerCount     int64
+		LikeCount       int64
+		CollectionCount int64
+	}
+	err := s.db.Raw(`SELECT
+		(SELECT COUNT(*) FROM questions WHERE author_id = @uid) AS question_count,
+		(SELECT COUNT(*) FROM answers WHERE author_id = @uid) AS answer_count,
+		(SELECT COALESCE(SUM(like_count), 0) FROM questions WHERE author_id = @uid)
+			+ (SELECT COALESCE(SUM(like_count), 0) FROM answers WHERE author_id = @uid) AS like_count,
+		(SELECT COUNT(*) FROM collections WHERE user_id = @uid) AS collection_count`,
+		map[string]any{"uid": userID}).Scan(&row).Error
+	if err != nil {
+		return nil, err
+	}
 
 	return &dto.UserStats{
-		QuestionCount:     int(questionTotal),
-		AnswerCount:       int(answerTotal),
-		LikeReceivedCount: int(questionLikes + answerLikes),
-		CollectionCount:   int(collectionCount),
+		QuestionCount:     int(row.QuestionCount),
+		AnswerCount:       int(row.AnswerCount),
+		LikeReceivedCount: int(row.LikeCount),
+		CollectionCount:   int(row.CollectionCount),
 	}, nil
 }
@@ -63,3 +63,25 @@ func TestBuildUserResponse_NormalizesDadChatStyle(t *testing.T) {
 		t.Fatalf("dad_chat_style = %q, want %q", resp.DadChatStyle, model.DadChatStyleTerminal)
 	}
 }
+
+func TestNormalizeShellCode(t *testing.T) {
+	tests := []struct {
+		in    string
+		want  string
+		valid bool
+	}{
+		{in: "ABCD2345", want: "ABCD2345", valid: true},
+		{in: " abcd2345 ", want: "ABCD2345", valid: true},
+		{in: "ABCD234", want: "ABCD234", valid: false},
+		{in: "ABCD23450", want: "ABCD23450", valid: false},
+		{in: "ABCD2340", want: "ABCD2340", valid: false}, // 0 is not in the charset
+		{in: "", want: "", valid: false},
+	}
+
+	for _, tc := range tests {
+		got, ok := normalizeShellCode(tc.in)
+		if got != tc.want || ok != tc.valid {
+			t.Errorf("normalizeShellCode(%q) = %q, %v; want %q, %v", tc.in, got, ok, tc.want, tc.valid)
+		}
+	}
+}
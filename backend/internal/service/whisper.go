@@ -52,7 +52,7 @@ func NewWhisperService(
 
 // CreateWhisper creates a new whisper from a mom user.
 func (s *WhisperService) CreateWhisper(authorID, content string) (*dto.WhisperItem, error) {
-	user, err := s.userRepo.FindByID(authorID)
+	user, err := s.userRepo.FindBinding(authorID)
 	if err != nil {
 		return nil, errors.New(errWhisperUserNotFound)
 	}
@@ -89,7 +89,7 @@ func (s *WhisperService) CreateWhisper(authorID, content string) (*dto.WhisperIt
 // GetWhispers returns whispers for the partner to read.
 // If the caller is Dad, returns Mom's whispers.
 func (s *WhisperService) GetWhispers(callerID string) ([]dto.WhisperItem, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errWhisperUserNotFound)
 	}
@@ -141,7 +141,7 @@ const whisperTipsPrompt = `你是「小石光」，一位温柔的家庭关系
 
 // GetWhisperTips generates AI tips for Dad based on Mom's whispers.
 func (s *WhisperService) GetWhisperTips(callerID string) (*dto.WhisperTips, error) {
-	user, err := s.userRepo.FindByID(callerID)
+	user, err := s.userRepo.FindBinding(callerID)
 	if err != nil {
 		return nil, errors.New(errWhisperUserNotFound)
 	}
@@ -186,12 +186,13 @@ func (s *WhisperService) GetFutureLetterView(callerID string) (*dto.FutureLetter
 	}
 
 	currentAgeStage := resolvedFutureLetterAgeStage(user, s.userRepo, s.chatRepo)
+	now := time.Now()
 
 	// Use AI to generate template dynamically (skip for Dad, cache for Mom)
 	var template futureLetterTemplate
 	if user.Role == model.RoleMom && s.aiClient != nil && user.PartnerID != nil {
 		ck := coupleKey(user.ID, *user.PartnerID)
-		date := time.Now().Format("2006-01-02")
+		date := now.Format("2006-01-02")
 		if cache, err := s.taskRepo.FindAICache(ck, date, "future-letter-template"); err == nil && cache != nil {
 			_ = json.Unmarshal([]byte(cache.Content), &template)
 		}
@@ -250,13 +251,7 @@ Structure (必须遵循的模板结构) 并严格输出为以下JSON格式：
 				respStr = llmvalidate.Sanitize(respStr)
 
 				// Cross-validate: structure + content safety review
-				ltVR, cvErr := llmvalidate.CrossValidate(context.Background(), s.aiClient, llmvalidate.TypeLetterTemplate, respStr, "")
-				if cvErr != nil {
-					log.Printf("[WhisperLetter] template cross-validate error: %v", cvErr)
-				}
-				if ltVR != nil && !ltVR.Valid {
-					log.Printf("[WhisperLetter] template structure invalid: %v", ltVR.StructErrors)
-				}
+				s.crossValidateInBackground("template", llmvalidate.TypeLetterTemplate, respStr)
 
 				var aiTemplate struct {
 					Title      string                     `json:"title"`
@@ -268,7 +263,7 @@ Structure (必须遵循的模板结构) 并严格输出为以下JSON格式：
 				}
 				if err := json.Unmarshal([]byte(llmvalidate.StripCodeFence(respStr)), &aiTemplate); err == nil {
 					template = futureLetterTemplate{
-						Code:       fmt.Sprintf("ai-dynamic-%d", time.Now().Unix()),
+						Code:       fmt.Sprintf("ai-dynamic-%d", now.Unix()),
 						Title:      aiTemplate.Title,
 						Intro:      aiTemplate.Intro,
 						Outro:      aiTemplate.Outro,
@@ -292,7 +287,7 @@ Structure (必须遵循的模板结构) 并严格输出为以下JSON格式：
 	}
 
 	if template.Code == "" {
-		template = buildFutureLetterTemplate(selectFutureLetterCode(items, currentAgeStage, time.Now()))
+		template = buildFutureLetterTemplate(selectFutureLetterCode(items, currentAgeStage, now))
 	}
 
 	view := &dto.FutureLetterView{
@@ -523,9 +518,8 @@ func (s *WhisperService) collectFutureLetterAdviceContext(
 			}
 		}
 
-		if facts, err := s.chatRepo.FindFactsByUserID(author.ID); err == nil {
-			limit := min(len(facts), 12)
-			for _, fact := range facts[:limit] {
+		if facts, err := s.chatRepo.FindFactsByUserID(author.ID, 12); err == nil {
+			for _, fact := range facts {
 				ctx.FactLines = append(ctx.FactLines, fmt.Sprintf("- [%s] %s", fact.Category, fact.Content))
 			}
 		}
@@ -655,13 +649,7 @@ JSON 格式：
 	cleaned := llmvalidate.StripCodeFence(llmvalidate.Sanitize(resp))
 
 	// Cross-validate: structure + content safety review
-	avr, cvErr := llmvalidate.CrossValidate(reqCtx, s.aiClient, llmvalidate.TypeAdviceResponse, cleaned, "")
-	if cvErr != nil {
-		log.Printf("[WhisperLetter] advice cross-validate error: %v", cvErr)
-	}
-	if avr != nil && !avr.Valid {
-		log.Printf("[WhisperLetter] advice structure invalid: %v", avr.StructErrors)
-	}
+	s.crossValidateInBackground("advice", llmvalidate.TypeAdviceResponse, cleaned)
 
 	var payload futureLetterAIAdvice
 	if err := json.Unmarshal([]byte(cleaned), &payload); err != nil {
@@ -724,9 +712,8 @@ func (s *WhisperService) translateDadMissionWithAI(author *model.User, letterCod
 
 	var factLines []string
 	if s.chatRepo != nil {
-		if facts, err := s.chatRepo.FindFactsByUserID(author.ID); err == nil {
-			limit := min(len(facts), 12)
-			for _, fact := range facts[:limit] {
+		if facts, err := s.chatRepo.FindFactsByUserID(author.ID, 12); err == nil {
+			for _, fact := range facts {
 				factLines = append(factLines, fmt.Sprintf("- [%s] %s", fact.Category, fact.Content))
 			}
 		}
@@ -841,13 +828,7 @@ JSON 格式：
 	cleaned := llmvalidate.StripCodeFence(llmvalidate.Sanitize(resp))
 
 	// Cross-validate: structure + content safety review
-	mvr, cvErr := llmvalidate.CrossValidate(ctx, s.aiClient, llmvalidate.TypeMissionResponse, cleaned, "")
-	if cvErr != nil {
-		log.Printf("[WhisperLetter] mission cross-validate error: %v", cvErr)
-	}
-	if mvr != nil && !mvr.Valid {
-		log.Printf("[WhisperLetter] mission structure invalid: %v", mvr.StructErrors)
-	}
+	s.crossValidateInBackground("mission", llmvalidate.TypeMissionResponse, cleaned)
 
 	var payload futureLetterAIMission
 	if err := json.Unmarshal([]byte(cleaned), &payload); err != nil {
@@ -879,32 +860,75 @@ JSON 格式：
 	}, nil
 }
 
-func normalizeDadAdviceItems(items []dadAdviceItemDef) []dadAdviceItemDef {
-	validKinds := map[string]bool{
-		"decode":  true,
-		"opening": true,
-		"observe": true,
-		"avoid":   true,
+// crossValidateInBackground reviews a generated payload without holding up
+// the caller. These verdicts are only logged, so the letter is returned as
+// soon as the first LLM call finishes instead of after a second round-trip.
+func (s *WhisperService) crossValidateInBackground(kind string, responseType llmvalidate.ResponseType, content string) {
+	go func() {
+		ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+		defer cancel()
+
+		vr, err := llmvalidate.CrossValidate(ctx, s.aiClient, responseType, content, "")
+		if err != nil {
+			log.Printf("[WhisperLetter] %s cross-validate error: %v", kind, err)
+			return
+		}
+		if vr != nil && !vr.Valid {
+			log.Printf("[WhisperLetter] %s structure invalid: %v", kind, vr.StructErrors)
+		}
+	}()
+}
+
+// dadAdviceKinds lists the advice kinds in display order.
+var dadAdviceKinds = [...]string{"decode", "opening", "observe", "avoid"}
+
+// dadAdviceKindSlot maps each kind to its index in dadAdviceKinds.
+var dadAdviceKindSlot = func() map[string]int {
+	m := make(map[string]int, len(dadAdviceKinds))
+	for i, kind := range dadAdviceKinds {
+		m[kind] = i
 	}
+	return m
+}()
+
+// dadAdviceSlots keeps the first item seen for each kind, in display order.
+type dadAdviceSlots struct {
+	items  [len(dadAdviceKinds)]dadAdviceItemDef
+	filled [len(dadAdviceKinds)]bool
+}
 
-	normalized := make([]dadAdviceItemDef, 0, len(items))
+func (s *dadAdviceSlots) list() []dadAdviceItemDef {
+	out := make([]dadAdviceItemDef, 0, len(s.items))
+	for i := range s.items {
+		if s.filled[i] {
+			out = append(out, s.items[i])
+		}
+	}
+	return out
+}
+
+// normalizeDadAdviceItems cleans the items and orders them by kind in a
+// single pass; unknown kinds count as "decode".
+func normalizeDadAdviceItems(items []dadAdviceItemDef) []dadAdviceItemDef {
+	var slots dadAdviceSlots
 	for _, item := range items {
 		title := strings.TrimSpace(item.Title)
 		description := strings.TrimSpace(item.Description)
-		kind := strings.TrimSpace(strings.ToLower(item.Kind))
 		if title == "" || description == "" {
 			continue
 		}
-		if !validKinds[kind] {
-			kind = "decode"
+		slot := dadAdviceKindSlot[strings.TrimSpace(strings.ToLower(item.Kind))]
+		if slots.filled[slot] {
+			continue
 		}
-		normalized = append(normalized, dadAdviceItemDef{
+		slots.items[slot] = dadAdviceItemDef{
 			Title:       truncateRunes(title, 12),
 			Description: description,
-			Kind:        kind,
-		})
+			Kind:        dadAdviceKinds[slot],
+		}
+		slots.filled[slot] = true
 	}
-	return reorderDadAdviceItems(normalized)
+	return slots.list()
 }
 
 func normalizeDadAdviceSources(sources []dadAdviceSourceDef) []dadAdviceSourceDef {
@@ -1092,21 +1116,16 @@ func buildFallbackAdviceItems(ctx futureLetterAdviceContext) []dadAdviceItemDef
 }
 
 func reorderDadAdviceItems(items []dadAdviceItemDef) []dadAdviceItemDef {
-	order := []string{"decode", "opening", "observe", "avoid"}
-	byKind := make(map[string]dadAdviceItemDef, len(items))
+	var slots dadAdviceSlots
 	for _, item := range items {
-		if _, exists := byKind[item.Kind]; !exists {
-			byKind[item.Kind] = item
-		}
-	}
-
-	reordered := make([]dadAdviceItemDef, 0, len(order))
-	for _, kind := range order {
-		if item, ok := byKind[kind]; ok {
-			reordered = append(reordered, item)
+		slot, ok := dadAdviceKindSlot[item.Kind]
+		if !ok || slots.filled[slot] {
+			continue
 		}
+		slots.items[slot] = item
+		slots.filled[slot] = true
 	}
-	return reordered
+	return slots.list()
 }
 
 func fallbackAdviceHeadline(stateTag string) string {
@@ -1290,7 +1309,23 @@ func deriveAgeStageFromBirthDate(birthDate *time.Time) string {
 	}
 }
 
+// futureLetterTemplates holds the built-in letters. They depend only on the
+// letter code, so each is rendered once and shared read-only.
+var futureLetterTemplates = map[string]futureLetterTemplate{
+	futureLetterCodeOverview:   renderFutureLetterTemplate(futureLetterCodeOverview),
+	futureLetterCodePrenatal:   renderFutureLetterTemplate(futureLetterCodePrenatal),
+	futureLetterCodeVaccine:    renderFutureLetterTemplate(futureLetterCodeVaccine),
+	futureLetterCodeSafetySeat: renderFutureLetterTemplate(futureLetterCodeSafetySeat),
+}
+
 func buildFutureLetterTemplate(code string) futureLetterTemplate {
+	if template, ok := futureLetterTemplates[code]; ok {
+		return template
+	}
+	return futureLetterTemplates[futureLetterCodeOverview]
+}
+
+func renderFutureLetterTemplate(code string) futureLetterTemplate {
 	switch code {
 	case futureLetterCodePrenatal:
 		return futureLetterTemplate{
@@ -1380,8 +1415,9 @@ func (s *WhisperService) syncDadMissionTasks(dadID, momID string, mission dadMis
 	_ = s.taskRepo.DeleteAICacheByCouple(ck, dateStr, "tips")
 	_ = s.taskRepo.DeleteAICacheByCouple(ck, dateStr, "future-letter-template")
 
+	tasks := make([]model.UserTask, 0, len(mission.Tasks))
 	for _, task := range mission.Tasks {
-		ut := &model.UserTask{
+		ut := model.UserTask{
 			UserID:        dadID,
 			Date:          date,
 			Status:        model.TaskPending,
@@ -1395,12 +1431,10 @@ func (s *WhisperService) syncDadMissionTasks(dadID, momID string, mission dadMis
 		if ut.Priority == "" {
 			ut.Priority = model.PriorityT1
 		}
-		if err := s.taskRepo.CreateUserTask(ut); err != nil {
-			return err
-		}
+		tasks = append(tasks, ut)
 	}
 
-	return nil
+	return s.taskRepo.CreateUserTasks(tasks)
 }
 
 func (s *WhisperService) persistWish(authorID, wish string) {
@@ -281,3 +281,19 @@ func TestDeriveAgeStageFromBirthDate(t *testing.T) {
 		t.Errorf("2000-day-old should be 4-5y, got %q", got)
 	}
 }
+
+func TestBuildFutureLetterTemplate(t *testing.T) {
+	for _, code := range []string{futureLetterCodeOverview, futureLetterCodePrenatal, futureLetterCodeVaccine, futureLetterCodeSafetySeat} {
+		got := buildFutureLetterTemplate(code)
+		if got.Code != code {
+			t.Errorf("buildFutureLetterTemplate(%q).Code = %q", code, got.Code)
+		}
+		if len(got.Questions) != 2 {
+			t.Errorf("buildFutureLetterTemplate(%q) has %d questions, want 2", code, len(got.Questions))
+		}
+	}
+
+	if got := buildFutureLetterTemplate("unknown"); got.Code != futureLetterCodeOverview {
+		t.Errorf("unknown code fell back to %q, want %q", got.Code, futureLetterCodeOverview)
+	}
+}
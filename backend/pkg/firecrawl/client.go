@@ -6,20 +6,106 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
+	"strconv"
+	"strings"
+	"sync"
 	"time"
+
+	"golang.org/x/sync/singleflight"
 )
 
 type Client struct {
 	apiKey string
-	http   *http.Client
+	// authHeader is the Authorization value, built once instead of per search
+	authHeader string
+	searchURL  string
+	http       *http.Client
+
+	mu    sync.Mutex
+	cache map[string]cachedSearch
+
+	// inflight lets concurrent misses for the same query share one request,
+	// e.g. several comments on one question each asking the community AI.
+	inflight singleflight.Group
+}
+
+// Common questions ("产后抑郁怎么办", "盆底肌修复") recur across users, and web
+// results for them barely move within an hour, so successful searches are
+// reused for searchCacheTTL. The cache is bounded at searchCacheMaxEntries.
+const (
+	searchCacheTTL        = time.Hour
+	searchCacheMaxEntries = 512
+)
+
+type cachedSearch struct {
+	results   []SearchResult
+	expiresAt time.Time
 }
 
+// transport keeps a warm pool of connections to the single Firecrawl host.
+// http.DefaultTransport only keeps two idle connections per host, so
+// concurrent searches would re-dial and redo the TLS handshake. HTTP/2 stays
+// enabled, and a dead host fails at connect time instead of using up the
+// whole request timeout.
+var transport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.DialContext = (&net.Dialer{Timeout: 5 * time.Second, KeepAlive: 30 * time.Second}).DialContext
+	t.MaxIdleConnsPerHost = 32
+	t.ForceAttemptHTTP2 = true
+	return t
+}()
+
+const defaultSearchURL = "https://api.firecrawl.dev/v1/search"
+
 func NewClient(apiKey string) *Client {
 	return &Client{
-		apiKey: apiKey,
-		http:   &http.Client{Timeout: 30 * time.Second},
+		apiKey:     apiKey,
+		authHeader: "Bearer " + apiKey,
+		searchURL:  defaultSearchURL,
+		http:       &http.Client{Timeout: 30 * time.Second, Transport: transport},
+		cache:      make(map[string]cachedSearch),
+	}
+}
+
+func searchCacheKey(query string, limit int) string {
+	return strings.ToLower(strings.Join(strings.Fields(query), " ")) + "|" + strconv.Itoa(limit)
+}
+
+func (c *Client) cachedResults(key string) ([]SearchResult, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	entry, ok := c.cache[key]
+	if !ok {
+		return nil, false
+	}
+	if time.Now().After(entry.expiresAt) {
+		delete(c.cache, key)
+		return nil, false
 	}
+	return entry.results, true
+}
+
+func (c *Client) storeResults(key string, results []SearchResult) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if len(c.cache) >= searchCacheMaxEntries {
+		now := time.Now()
+		for k, entry := range c.cache {
+			if now.After(entry.expiresAt) {
+				delete(c.cache, k)
+			}
+		}
+		// Still full: drop an arbitrary tenth to make room
+		for k := range c.cache {
+			if len(c.cache) < searchCacheMaxEntries*9/10 {
+				break
+			}
+			delete(c.cache, k)
+		}
+	}
+	c.cache[key] = cachedSearch{results: results, expiresAt: time.Now().Add(searchCacheTTL)}
 }
 
 type SearchResult struct {
@@ -44,17 +130,40 @@ func (c *Client) Search(ctx context.Context, query string, limit int) ([]SearchR
 		return nil, nil
 	}
 
+	key := searchCacheKey(query, limit)
+	if results, ok := c.cachedResults(key); ok {
+		return results, nil
+	}
+
+	// The shared request outlives any one caller's cancellation so the
+	// others still get (and the cache still stores) its result; each caller
+	// stops waiting when its own context ends.
+	ch := c.inflight.DoChan(key, func() (any, error) {
+		return c.search(context.WithoutCancel(ctx), key, query, limit)
+	})
+	select {
+	case res := <-ch:
+		if res.Err != nil {
+			return nil, res.Err
+		}
+		return res.Val.([]SearchResult), nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+func (c *Client) search(ctx context.Context, key, query string, limit int) ([]SearchResult, error) {
 	body, err := json.Marshal(searchRequest{Query: query, Limit: limit})
 	if err != nil {
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	req, err := http.NewRequestWithContext(ctx, "POST", "https://api.firecrawl.dev/v1/search", bytes.NewReader(body))
+	req, err := http.NewRequestWithContext(ctx, "POST", c.searchURL, bytes.NewReader(body))
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
 	req.Header.Set("Content-Type", "application/json")
-	req.Header.Set("Authorization", "Bearer "+c.apiKey)
+	req.Header.Set("Authorization", c.authHeader)
 
 	resp, err := c.http.Do(req)
 	if err != nil {
@@ -62,19 +171,17 @@ func (c *Client) Search(ctx context.Context, query string, limit int) ([]SearchR
 	}
 	defer func() { _ = resp.Body.Close() }()
 
-	respBody, err := io.ReadAll(io.LimitReader(resp.Body, 1<<20)) // 1 MB max
-	if err != nil {
-		return nil, fmt.Errorf("failed to read response: %w", err)
-	}
-
 	if resp.StatusCode != http.StatusOK {
 		return nil, fmt.Errorf("firecrawl search failed: status %d", resp.StatusCode)
 	}
 
+	// Decode straight from the body rather than buffering it with ReadAll
+	// first; results carry page markdown, so responses run to hundreds of KB.
 	var searchResp searchResponse
-	if err := json.Unmarshal(respBody, &searchResp); err != nil {
+	if err := json.NewDecoder(io.LimitReader(resp.Body, 1<<20)).Decode(&searchResp); err != nil { // 1 MB max
 		return nil, fmt.Errorf("failed to parse response: %w", err)
 	}
 
+	c.storeResults(key, searchResp.Data)
 	return searchResp.Data, nil
 }
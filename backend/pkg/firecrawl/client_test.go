@@ -0,0 +1,241 @@
+package firecrawl
+
+import (
+	"context"
+	"encoding/json"
+	"errors"
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// newTestServer answers every search with one result and counts the hits.
+func newTestServer(t *testing.T, status int) (*httptest.Server, *atomic.Int32) {
+	t.Helper()
+	var hits atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		hits.Add(1)
+		if status != http.StatusOK {
+			w.WriteHeader(status)
+			return
+		}
+		var req searchRequest
+		_ = json.NewDecoder(r.Body).Decode(&req)
+		_ = json.NewEncoder(w).Encode(searchResponse{
+			Success: true,
+			Data:    []SearchResult{{URL: "https://example.com", Title: req.Query}},
+		})
+	}))
+	t.Cleanup(srv.Close)
+	return srv, &hits
+}
+
+func newTestClient(url string) *Client {
+	c := NewClient("key")
+	c.searchURL = url
+	return c
+}
+
+func TestSearch_CacheHitWithinTTL(t *testing.T) {
+	srv, hits := newTestServer(t, http.StatusOK)
+	c := newTestClient(srv.URL)
+
+	for i := 0; i < 3; i++ {
+		results, err := c.Search(context.Background(), "盆底肌修复", 3)
+		if err != nil {
+			t.Fatalf("unexpected error: %v", err)
+		}
+		if len(results) != 1 || results[0].Title != "盆底肌修复" {
+			t.Fatalf("unexpected results: %+v", results)
+		}
+	}
+	if got := hits.Load(); got != 1 {
+		t.Errorf("expected 1 upstream request, got %d", got)
+	}
+}
+
+func TestSearch_CacheExpires(t *testing.T) {
+	srv, hits := newTestServer(t, http.StatusOK)
+	c := newTestClient(srv.URL)
+
+	if _, err := c.Search(context.Background(), "产后脱发", 3); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	key := searchCacheKey("产后脱发", 3)
+	c.mu.Lock()
+	entry := c.cache[key]
+	entry.expiresAt = time.Now().Add(-time.Second)
+	c.cache[key] = entry
+	c.mu.Unlock()
+
+	if _, err := c.Search(context.Background(), "产后脱发", 3); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got := hits.Load(); got != 2 {
+		t.Errorf("expected expired entry to be refetched, got %d upstream requests", got)
+	}
+}
+
+func TestSearchCacheKey_NormalizesQuery(t *testing.T) {
+	want := searchCacheKey("postpartum hair loss", 3)
+	for _, q := range []string{"Postpartum Hair Loss", "  postpartum   hair\tloss ", "POSTPARTUM HAIR LOSS"} {
+		if got := searchCacheKey(q, 3); got != want {
+			t.Errorf("searchCacheKey(%q) = %q, want %q", q, got, want)
+		}
+	}
+	if searchCacheKey("postpartum hair loss", 5) == want {
+		t.Error("expected different limits to use different keys")
+	}
+}
+
+func TestSearch_ErrorsAreNotCached(t *testing.T) {
+	srv, hits := newTestServer(t, http.StatusInternalServerError)
+	c := newTestClient(srv.URL)
+
+	for i := 0; i < 2; i++ {
+		if _, err := c.Search(context.Background(), "月子中心", 3); err == nil {
+			t.Fatal("expected error for 500 response")
+		}
+	}
+	if got := hits.Load(); got != 2 {
+		t.Errorf("expected every failed search to hit upstream, got %d requests", got)
+	}
+	if len(c.cache) != 0 {
+		t.Errorf("expected empty cache, got %d entries", len(c.cache))
+	}
+}
+
+func TestStoreResults_StaysWithinMaxEntries(t *testing.T) {
+	c := NewClient("key")
+	for i := 0; i < searchCacheMaxEntries*3; i++ {
+		c.storeResults(strconv.Itoa(i), nil)
+		if len(c.cache) > searchCacheMaxEntries {
+			t.Fatalf("cache grew to %d entries, max is %d", len(c.cache), searchCacheMaxEntries)
+		}
+	}
+	if _, ok := c.cachedResults(strconv.Itoa(searchCacheMaxEntries*3 - 1)); !ok {
+		t.Error("expected the newest entry to be cached")
+	}
+}
+
+func TestSearch_NoAPIKey(t *testing.T) {
+	results, err := NewClient("").Search(context.Background(), "q", 3)
+	if err != nil || results != nil {
+		t.Errorf("expected nil, nil without an API key, got %v, %v", results, err)
+	}
+}
+
+// newBlockingServer holds every search until release is closed, and signals
+// started when the first request arrives.
+func newBlockingServer(t *testing.T) (srv *httptest.Server, hits *atomic.Int32, started <-chan struct{}, release chan struct{}) {
+	t.Helper()
+	hits = new(atomic.Int32)
+	startedCh := make(chan struct{})
+	release = make(chan struct{})
+	var once sync.Once
+	srv = httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		hits.Add(1)
+		once.Do(func() { close(startedCh) })
+		select {
+		case <-release:
+		case <-r.Context().Done():
+			return
+		}
+		_ = json.NewEncoder(w).Encode(searchResponse{
+			Success: true,
+			Data:    []SearchResult{{URL: "https://example.com", Title: "t"}},
+		})
+	}))
+	t.Cleanup(srv.Close)
+	return srv, hits, startedCh, release
+}
+
+func TestSearch_ConcurrentCallersShareOneRequest(t *testing.T) {
+	srv, hits, started, release := newBlockingServer(t)
+	c := newTestClient(srv.URL)
+
+	const callers = 8
+	var wg sync.WaitGroup
+	errs := make(chan error, callers)
+	search := func() {
+		defer wg.Done()
+		results, err := c.Search(context.Background(), "宝宝发烧怎么办", 3)
+		if err == nil && len(results) != 1 {
+			err = errors.New("unexpected results")
+		}
+		errs <- err
+	}
+
+	wg.Add(1)
+	go search()
+	<-started
+	for i := 1; i < callers; i++ {
+		wg.Add(1)
+		go search()
+	}
+	// Give the followers time to join the in-flight request
+	time.Sleep(100 * time.Millisecond)
+	close(release)
+	wg.Wait()
+	close(errs)
+
+	for err := range errs {
+		if err != nil {
+			t.Errorf("unexpected error: %v", err)
+		}
+	}
+	if got := hits.Load(); got != 1 {
+		t.Errorf("expected 1 upstream request for %d callers, got %d", callers, got)
+	}
+}
+
+func TestSearch_CallerCancelDoesNotCancelSharedRequest(t *testing.T) {
+	srv, hits, started, release := newBlockingServer(t)
+	c := newTestClient(srv.URL)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	firstErr := make(chan error, 1)
+	go func() {
+		_, err := c.Search(ctx, "产后抑郁", 3)
+		firstErr <- err
+	}()
+	<-started
+
+	secondDone := make(chan struct{})
+	var secondResults []SearchResult
+	var secondErr error
+	go func() {
+		defer close(secondDone)
+		secondResults, secondErr = c.Search(context.Background(), "产后抑郁", 3)
+	}()
+	time.Sleep(50 * time.Millisecond)
+
+	cancel()
+	select {
+	case err := <-firstErr:
+		if !errors.Is(err, context.Canceled) {
+			t.Errorf("expected context.Canceled for the cancelled caller, got %v", err)
+		}
+	case <-time.After(time.Second):
+		t.Fatal("cancelled caller did not return")
+	}
+
+	close(release)
+	<-secondDone
+	if secondErr != nil {
+		t.Fatalf("expected the other caller to succeed, got %v", secondErr)
+	}
+	if len(secondResults) != 1 {
+		t.Errorf("unexpected results: %+v", secondResults)
+	}
+	if got := hits.Load(); got != 1 {
+		t.Errorf("expected 1 upstream request, got %d", got)
+	}
+	if _, ok := c.cachedResults(searchCacheKey("产后抑郁", 3)); !ok {
+		t.Error("expected the shared result to be cached")
+	}
+}
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"log"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/momshell/backend/pkg/openai"
 )
@@ -64,6 +65,11 @@ const crossValidateSystemPrompt = `你是一个 AI 输出审查员。你的任
 严格返回 JSON，不要其他内容：
 {"valid": true/false, "safe": true/false, "flags": [...], "appendix": "...", "struct_errors": [...]}`
 
+// crossValidateMaxTokens bounds the verdict. It is a short JSON object whose
+// longest field is the one-line appendix, so the 4096 tokens allowed for
+// free-form replies only add room for the model to ramble.
+const crossValidateMaxTokens = 512
+
 // CrossValidate makes a second LLM call to validate structure and content safety
 // of a previous LLM response. Returns nil result (not error) if the validation
 // call itself fails, allowing graceful degradation.
@@ -75,18 +81,12 @@ func CrossValidate(
 	rawResponse string,
 	webContext string,
 ) (*CrossValidateResult, error) {
-	var sb strings.Builder
-	fmt.Fprintf(&sb, "response_type: %s\n\n待审查内容：\n%s", responseType, rawResponse)
-	if webContext != "" {
-		fmt.Fprintf(&sb, "\n\n网络搜索参考资料：\n%s", webContext)
-	}
-
 	messages := []openai.Message{
 		{Role: "system", Content: crossValidateSystemPrompt},
-		{Role: "user", Content: sb.String()},
+		{Role: "user", Content: buildCrossValidateInput(responseType, rawResponse, webContext)},
 	}
 
-	resp, err := client.Chat(ctx, messages)
+	resp, err := client.ChatJSON(ctx, messages, crossValidateMaxTokens)
 	if err != nil {
 		return nil, fmt.Errorf("cross-validate LLM call failed: %w", err)
 	}
@@ -94,6 +94,39 @@ func CrossValidate(
 	return parseCrossValidateResult(resp)
 }
 
+// maxCrossValidateWebContext caps the search context sent for fact-checking,
+// in bytes. Input tokens dominate the review's latency, and the reply being
+// checked only draws on the first few sources anyway.
+const maxCrossValidateWebContext = 4000
+
+// buildCrossValidateInput assembles the review request in one sized buffer.
+func buildCrossValidateInput(responseType ResponseType, rawResponse, webContext string) string {
+	if len(webContext) > maxCrossValidateWebContext {
+		cut := maxCrossValidateWebContext
+		for cut > 0 && !utf8.RuneStart(webContext[cut]) {
+			cut--
+		}
+		webContext = webContext[:cut]
+	}
+
+	const (
+		typeLabel    = "response_type: "
+		contentLabel = "\n\n待审查内容：\n"
+		webLabel     = "\n\n网络搜索参考资料：\n"
+	)
+	var sb strings.Builder
+	sb.Grow(len(typeLabel) + len(responseType) + len(contentLabel) + len(rawResponse) + len(webLabel) + len(webContext))
+	sb.WriteString(typeLabel)
+	sb.WriteString(string(responseType))
+	sb.WriteString(contentLabel)
+	sb.WriteString(rawResponse)
+	if webContext != "" {
+		sb.WriteString(webLabel)
+		sb.WriteString(webContext)
+	}
+	return sb.String()
+}
+
 // parseCrossValidateResult extracts a CrossValidateResult from the LLM response.
 func parseCrossValidateResult(raw string) (*CrossValidateResult, error) {
 	cleaned := Sanitize(raw)
@@ -1,7 +1,9 @@
 package llmvalidate
 
 import (
+	"strings"
 	"testing"
+	"unicode/utf8"
 )
 
 func TestParseCrossValidateResult_ValidJSON(t *testing.T) {
@@ -101,3 +103,26 @@ func TestApplyAppendix_NilResult(t *testing.T) {
 		t.Errorf("ApplyAppendix() = %q, want %q", got, "原始文本")
 	}
 }
+
+func TestBuildCrossValidateInput_NoWebContext(t *testing.T) {
+	got := buildCrossValidateInput(TypePlainText, "你好", "")
+	want := "response_type: plain_text\n\n待审查内容：\n你好"
+	if got != want {
+		t.Errorf("buildCrossValidateInput() = %q, want %q", got, want)
+	}
+}
+
+func TestBuildCrossValidateInput_TruncatesWebContext(t *testing.T) {
+	web := strings.Repeat("资料", maxCrossValidateWebContext)
+	got := buildCrossValidateInput(TypeChatResponse, "回复", web)
+	_, tail, ok := strings.Cut(got, "网络搜索参考资料：\n")
+	if !ok {
+		t.Fatal("web context section missing")
+	}
+	if len(tail) > maxCrossValidateWebContext {
+		t.Errorf("web context len = %d, want <= %d", len(tail), maxCrossValidateWebContext)
+	}
+	if !utf8.ValidString(tail) {
+		t.Error("web context was cut mid-rune")
+	}
+}
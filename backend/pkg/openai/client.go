@@ -7,6 +7,7 @@ import (
 	"fmt"
 	"io"
 	"log"
+	"net"
 	"net/http"
 	"strings"
 	"time"
@@ -25,8 +26,25 @@ type Client struct {
 	model          string
 	embeddingModel string
 	http           *http.Client
+
+	// slots bounds the number of requests in flight; nil means unbounded.
+	slots chan struct{}
 }
 
+// transport is shared by every Client. The chat, embedding and image calls
+// all go to the one configured base URL, and a single chat turn can have
+// several of them in flight at once: the reply, cross-validation, and the RAG
+// rewrite, embedding and rerank. http.DefaultTransport keeps only two idle
+// connections per host, so the rest were re-dialled with a fresh TLS
+// handshake.
+var transport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.DialContext = (&net.Dialer{Timeout: 5 * time.Second, KeepAlive: 30 * time.Second}).DialContext
+	t.MaxIdleConnsPerHost = 64
+	t.ForceAttemptHTTP2 = true
+	return t
+}()
+
 func NewClient(apiKey, baseURL, model, embeddingModel string) *Client {
 	if baseURL == "" {
 		baseURL = "https://api.openai.com/v1"
@@ -36,8 +54,20 @@ func NewClient(apiKey, baseURL, model, embeddingModel string) *Client {
 		baseURL:        baseURL,
 		model:          model,
 		embeddingModel: embeddingModel,
-		http:           &http.Client{Timeout: 60 * time.Second},
+		http:           &http.Client{Timeout: 60 * time.Second, Transport: transport},
+	}
+}
+
+// SetMaxConcurrent caps how many requests the client sends at once. Callers
+// beyond the cap wait for a free slot (or for their context to end) instead
+// of piling onto a rate-limited upstream and failing with 429s. n <= 0
+// removes the cap. Call it before the client is shared.
+func (c *Client) SetMaxConcurrent(n int) {
+	if n <= 0 {
+		c.slots = nil
+		return
 	}
+	c.slots = make(chan struct{}, n)
 }
 
 type Message struct {
@@ -46,11 +76,16 @@ type Message struct {
 }
 
 type chatRequest struct {
-	Model          string    `json:"model"`
-	Messages       []Message `json:"messages"`
-	Temperature    float64   `json:"temperature"`
-	MaxTokens      int       `json:"max_tokens"`
-	EnableThinking bool      `json:"enable_thinking"`
+	Model          string          `json:"model"`
+	Messages       []Message       `json:"messages"`
+	Temperature    float64         `json:"temperature"`
+	MaxTokens      int             `json:"max_tokens"`
+	EnableThinking bool            `json:"enable_thinking"`
+	ResponseFormat *responseFormat `json:"response_format,omitempty"`
+}
+
+type responseFormat struct {
+	Type string `json:"type"`
 }
 
 type chatResponse struct {
@@ -67,6 +102,15 @@ type chatResponse struct {
 // doPost sends an authenticated POST request and returns the response body.
 // It handles marshaling, header setup, and status code validation.
 func (c *Client) doPost(ctx context.Context, path string, reqBody any, maxSize int64, extraHeaders map[string]string) ([]byte, error) {
+	if c.slots != nil {
+		select {
+		case c.slots <- struct{}{}:
+			defer func() { <-c.slots }()
+		case <-ctx.Done():
+			return nil, fmt.Errorf("request to %s not sent: %w", path, ctx.Err())
+		}
+	}
+
 	body, err := json.Marshal(reqBody)
 	if err != nil {
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
@@ -101,14 +145,30 @@ func (c *Client) doPost(ctx context.Context, path string, reqBody any, maxSize i
 }
 
 func (c *Client) Chat(ctx context.Context, messages []Message) (string, error) {
-	reqBody := chatRequest{
+	return c.chat(ctx, chatRequest{
 		Model:          c.model,
 		Messages:       messages,
 		Temperature:    0.7,
 		MaxTokens:      4096,
 		EnableThinking: false,
-	}
+	})
+}
+
+// ChatJSON is Chat for short structured replies. It requests JSON mode so the
+// server constrains the output to a single object, and caps generation at
+// maxTokens instead of the 4096 allowed for free-form replies.
+func (c *Client) ChatJSON(ctx context.Context, messages []Message, maxTokens int) (string, error) {
+	return c.chat(ctx, chatRequest{
+		Model:          c.model,
+		Messages:       messages,
+		Temperature:    0.7,
+		MaxTokens:      maxTokens,
+		EnableThinking: false,
+		ResponseFormat: &responseFormat{Type: "json_object"},
+	})
+}
 
+func (c *Client) chat(ctx context.Context, reqBody chatRequest) (string, error) {
 	respBody, err := c.doPost(ctx, "/chat/completions", reqBody, maxChatResponseSize, nil)
 	if err != nil {
 		return "", err
@@ -3,10 +3,12 @@ package openai
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"net/http"
 	"net/http/httptest"
 	"testing"
+	"time"
 )
 
 func TestExtractImagesFromTaskStatus_NotSucceed(t *testing.T) {
@@ -336,6 +338,57 @@ func TestChat_Success(t *testing.T) {
 	}
 }
 
+func TestChatJSON_RequestsJSONMode(t *testing.T) {
+	var got chatRequest
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		_ = json.NewDecoder(r.Body).Decode(&got)
+		_, _ = fmt.Fprint(w, `{"choices":[{"message":{"content":"{\"ok\":true}"}}]}`)
+	}))
+	defer srv.Close()
+
+	c := NewClient("key", srv.URL, "model", "dummy-embedding")
+	result, err := c.ChatJSON(context.Background(), []Message{
+		{Role: "user", Content: "hello"},
+	}, 128)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if result != `{"ok":true}` {
+		t.Errorf("expected JSON content, got %q", result)
+	}
+	if got.ResponseFormat == nil || got.ResponseFormat.Type != "json_object" {
+		t.Errorf("expected response_format json_object, got %+v", got.ResponseFormat)
+	}
+	if got.MaxTokens != 128 {
+		t.Errorf("expected max_tokens 128, got %d", got.MaxTokens)
+	}
+}
+
+func TestSetMaxConcurrent_WaitsForSlot(t *testing.T) {
+	release := make(chan struct{})
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		<-release
+		_, _ = fmt.Fprint(w, `{"choices":[{"message":{"content":"ok"}}]}`)
+	}))
+	defer srv.Close()
+	defer close(release)
+
+	c := NewClient("key", srv.URL, "model", "dummy-embedding")
+	c.SetMaxConcurrent(1)
+	msgs := []Message{{Role: "user", Content: "hello"}}
+
+	go func() { _, _ = c.Chat(context.Background(), msgs) }()
+	for len(c.slots) == 0 {
+		time.Sleep(time.Millisecond)
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 20*time.Millisecond)
+	defer cancel()
+	if _, err := c.Chat(ctx, msgs); !errors.Is(err, context.DeadlineExceeded) {
+		t.Fatalf("expected to time out waiting for a slot, got %v", err)
+	}
+}
+
 func TestGenerateImage_ServerError(t *testing.T) {
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
 		w.WriteHeader(http.StatusBadRequest)